@@ -9,11 +9,16 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import logging
 import multiprocessing as mp
+import os
+import shutil
+import signal
+import tempfile
+import time
 from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, Query, WebSocket, WebSocketDisconnect
 
@@ -33,11 +38,11 @@ app = FastAPI(title="SportsClips Agent (ASGI)")
 pipeline = create_highlight_pipeline(base_chunk_duration=4, window_size=9, slide_step=3)
 
 
-def create_snippet_message(
+def _build_snippet_dict(
     video_data: bytes, src_video_url: str, title: str, description: str
-) -> str:
-    """Create a JSON message containing a video snippet and metadata."""
-    message = {
+) -> dict[str, Any]:
+    """Build the snippet message as a dict, before JSON serialization."""
+    return {
         "type": "snippet",
         "data": {
             "video_data": base64.b64encode(video_data).decode("utf-8"),
@@ -48,24 +53,59 @@ def create_snippet_message(
             },
         },
     }
-    return json.dumps(message)
 
 
-def create_error_message(error: str, src_video_url: str | None = None) -> str:
-    """Create a JSON error message."""
+def _build_snippet_header_dict(
+    metadata: dict[str, Any], chunk_len: int
+) -> dict[str, Any]:
+    """Build the binary-snippet header message as a dict."""
+    return {
+        "type": "snippet_header",
+        "data": {
+            "video_length_bytes": chunk_len,
+            "metadata": metadata,
+        },
+    }
+
+
+def _build_error_dict(error: str, src_video_url: str | None = None) -> dict[str, Any]:
+    """Build the error message as a dict."""
     message: dict[str, Any] = {"type": "error", "message": error}
     if src_video_url:
         message["metadata"] = {"src_video_url": src_video_url}
-    return json.dumps(message)
+    return message
 
 
-def create_complete_message(src_video_url: str) -> str:
-    """Create a JSON completion message."""
-    message = {
+def _build_complete_dict(src_video_url: str) -> dict[str, Any]:
+    """Build the completion message as a dict."""
+    return {
         "type": "snippet_complete",
         "metadata": {"src_video_url": src_video_url},
     }
-    return json.dumps(message)
+
+
+def create_snippet_message(
+    video_data: bytes, src_video_url: str, title: str, description: str
+) -> str:
+    """Create a JSON message containing a video snippet and metadata."""
+    return orjson.dumps(
+        _build_snippet_dict(video_data, src_video_url, title, description)
+    ).decode()
+
+
+def create_snippet_header_message(metadata: dict[str, Any], chunk_len: int) -> str:
+    """Create the JSON text frame that precedes a binary snippet frame."""
+    return orjson.dumps(_build_snippet_header_dict(metadata, chunk_len)).decode()
+
+
+def create_error_message(error: str, src_video_url: str | None = None) -> str:
+    """Create a JSON error message."""
+    return orjson.dumps(_build_error_dict(error, src_video_url)).decode()
+
+
+def create_complete_message(src_video_url: str) -> str:
+    """Create a JSON completion message."""
+    return orjson.dumps(_build_complete_dict(src_video_url)).decode()
 
 
 SENTINEL_DONE = "__PIPELINE_DONE__"
@@ -74,15 +114,28 @@ SENTINEL_DONE = "__PIPELINE_DONE__"
 class QueueWebSocket:
     """Minimal ws-like object that pushes messages into a multiprocessing queue."""
 
-    def __init__(self, queue: mp.Queue[str]):
+    def __init__(self, queue: mp.Queue[str | bytes]):
         self._q = queue
 
-    def send(self, message: str) -> None:
+    def send(self, message: str | bytes) -> None:
         self._q.put(message)
 
 
-def _pipeline_worker(video_url: str, is_live: bool, q: mp.Queue[str]) -> None:
+def _pipeline_worker(
+    video_url: str,
+    is_live: bool,
+    q: mp.Queue[str | bytes],
+    binary: bool = False,
+    temp_root: str | None = None,
+) -> None:
     """Worker process entrypoint to run the async pipeline."""
+    # Lead a process group, so yt-dlp and ffmpeg children can be stopped with us
+    os.setpgrp()
+    if temp_root:
+        # Keep every temp file of this run (ours and our children's) under a
+        # directory the parent deletes once we are gone
+        tempfile.tempdir = temp_root
+        os.environ["TMPDIR"] = temp_root
     try:
         child_pipeline = create_highlight_pipeline(
             base_chunk_duration=4, window_size=9, slide_step=3
@@ -98,6 +151,9 @@ def _pipeline_worker(video_url: str, is_live: bool, q: mp.Queue[str]) -> None:
                 create_complete_message=create_complete_message,
                 create_error_message=create_error_message,
                 enable_live_commentary=True,
+                create_snippet_header_message=(
+                    create_snippet_header_message if binary else None
+                ),
             )
 
         asyncio.run(run())
@@ -113,19 +169,62 @@ def _pipeline_worker(video_url: str, is_live: bool, q: mp.Queue[str]) -> None:
             pass
 
 
+def _signal_group(pgid: int, sig: int) -> bool:
+    """Send a signal to a process group; False if the group no longer exists."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def _stop_worker(proc: mp.process.BaseProcess, timeout: float = 5.0) -> None:
+    """
+    Stop a pipeline worker together with the yt-dlp/ffmpeg processes it started.
+
+    The worker leads its own process group, so signalling the group reaches
+    its children as well. Returns once none of them is left running (or
+    after SIGKILL), so the caller can safely delete the worker's files.
+    """
+    pgid = proc.pid
+    if pgid is None:
+        return
+    if proc.is_alive() and not _signal_group(pgid, signal.SIGTERM):
+        # The worker hasn't made its process group yet
+        proc.terminate()
+    proc.join(timeout)
+
+    deadline = time.monotonic() + timeout
+    # Signal 0 only checks whether anyone in the group is still there
+    while _signal_group(pgid, 0) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    if _signal_group(pgid, signal.SIGKILL) or proc.is_alive():
+        proc.kill()
+        proc.join(timeout)
+
+
 @app.websocket("/ws/video-snippets")
 async def video_snippets_ws(
     websocket: WebSocket,
     video_url: str = Query(...),
     is_live: bool = Query(...),
+    binary: bool = Query(False),
 ) -> None:
-    """ASGI WebSocket endpoint that streams snippet messages."""
+    """
+    ASGI WebSocket endpoint that streams snippet messages.
+
+    With `binary=true`, each snippet is sent as a JSON header text frame
+    followed by the raw MP4 bytes in a binary frame instead of base64 JSON.
+    """
     await websocket.accept()
 
     ctx = mp.get_context("spawn")
-    q: mp.Queue[str] = ctx.Queue()
+    q: mp.Queue[str | bytes] = ctx.Queue()
+    temp_root = tempfile.mkdtemp(prefix="sportsclips_")
     proc = ctx.Process(
-        target=_pipeline_worker, args=(video_url, is_live, q), daemon=True
+        target=_pipeline_worker,
+        args=(video_url, is_live, q, binary, temp_root),
+        daemon=True,
     )
     proc.start()
 
@@ -141,14 +240,17 @@ async def video_snippets_ws(
             if msg == SENTINEL_DONE:
                 break
 
-            await websocket.send_text(msg)
+            if isinstance(msg, bytes):
+                await websocket.send_bytes(msg)
+            else:
+                await websocket.send_text(msg)
 
     except WebSocketDisconnect:
         pass
     finally:
-        if proc.is_alive():
-            proc.terminate()
-        proc.join(timeout=5)
+        await asyncio.to_thread(_stop_worker, proc)
+        # Only now is nothing left writing to the worker's files
+        shutil.rmtree(temp_root, ignore_errors=True)
 
         try:
             while True:
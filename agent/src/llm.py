@@ -16,7 +16,7 @@ from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable
 from urllib.request import urlopen
 
 from google import genai
@@ -39,7 +39,7 @@ class AgentInput:
 
     modality: ModalityType
     data: Any  # Can be str, bytes, Path, or any custom type
-    metadata: Optional[dict[str, Any]] = None
+    metadata: dict[str, Any] | None = None
 
     def __repr__(self) -> str:
         data_preview = (
@@ -56,7 +56,7 @@ class AgentOutput:
 
     modality: ModalityType
     data: Any  # Can be str, bytes, or any custom type
-    metadata: Optional[dict[str, Any]] = None
+    metadata: dict[str, Any] | None = None
 
     def __repr__(self) -> str:
         data_preview = (
@@ -125,7 +125,7 @@ class TextInputHook(InputHook):
 class VideoInputHook(InputHook):
     """Hook for processing video input."""
 
-    def process(self, raw_input: Union[bytes, Path, str]) -> AgentInput:
+    def process(self, raw_input: bytes | Path | str) -> AgentInput:
         """
         Process video input.
 
@@ -150,7 +150,7 @@ class VideoInputHook(InputHook):
 class AudioInputHook(InputHook):
     """Hook for processing audio input."""
 
-    def process(self, raw_input: Union[bytes, Path, str]) -> AgentInput:
+    def process(self, raw_input: bytes | Path | str) -> AgentInput:
         """
         Process audio input.
 
@@ -174,7 +174,7 @@ class AudioInputHook(InputHook):
 class ImageInputHook(InputHook):
     """Hook for processing image input."""
 
-    def process(self, raw_input: Union[bytes, Path, str]) -> AgentInput:
+    def process(self, raw_input: bytes | Path | str) -> AgentInput:
         """
         Process image input.
 
@@ -270,7 +270,7 @@ class GeminiAgent:
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash"
+        self, api_key: str | None = None, model_name: str = "gemini-2.5-flash"
     ):
         """
         Initialize the Gemini agent.
@@ -369,7 +369,7 @@ class GeminiAgent:
         self,
         inputs: list[AgentInput],
         output_modality: ModalityType = ModalityType.TEXT,
-        tools: Optional[list[Any]] = None,
+        tools: list[Any] | None = None,
         **generation_config: Any,
     ) -> AgentOutput:
         """
@@ -599,7 +599,7 @@ class GeminiAgent:
             raise ValueError(f"Failed to generate content: {str(e)}")
 
     async def generate_text(
-        self, prompt: str, context_inputs: Optional[list[AgentInput]] = None
+        self, prompt: str, context_inputs: list[AgentInput] | None = None
     ) -> str:
         """
         Convenience method for text generation.
@@ -622,10 +622,10 @@ class GeminiAgent:
 
     async def generate_from_video(
         self,
-        video_input: Union[bytes, Path, str],
+        video_input: bytes | Path | str,
         prompt: str,
-        tools: Optional[list[Any]] = None,
-    ) -> Union[str, dict[str, Any]]:
+        tools: list[Any] | None = None,
+    ) -> str | dict[str, Any]:
         """
         Convenience method for video understanding.
 
@@ -657,7 +657,7 @@ class GeminiAgent:
         return result
 
     async def generate_from_audio(
-        self, audio_input: Union[bytes, Path, str], prompt: str
+        self, audio_input: bytes | Path | str, prompt: str
     ) -> str:
         """
         Convenience method for audio understanding.
@@ -682,9 +682,9 @@ class GeminiAgent:
     async def generate_multimodal(
         self,
         text_prompts: list[str],
-        images: Optional[list[Union[bytes, Path, str]]] = None,
-        videos: Optional[list[Union[bytes, Path, str]]] = None,
-        audios: Optional[list[Union[bytes, Path, str]]] = None,
+        images: list[bytes | Path | str] | None = None,
+        videos: list[bytes | Path | str] | None = None,
+        audios: list[bytes | Path | str] | None = None,
         output_modality: ModalityType = ModalityType.TEXT,
     ) -> Any:
         """
@@ -735,9 +735,9 @@ class GeminiLiveClient:
 
     def __init__(
         self,
-        api_key: Optional[str] = None,
+        api_key: str | None = None,
         model_name: str = "gemini-live-2.5-flash-preview",
-        system_instruction: Optional[str] = None,
+        system_instruction: str | None = None,
     ):
         """
         Initialize the Live API client.
@@ -753,9 +753,9 @@ class GeminiLiveClient:
             system_instruction
             or "You are a helpful sports commentator providing live audio commentary."
         )
-        self._client: Optional[genai.Client] = None
+        self._client: genai.Client | None = None
         self._session: Any = None
-        self._connection_context: Optional[AbstractAsyncContextManager[Any]] = None
+        self._connection_context: AbstractAsyncContextManager[Any] | None = None
 
         if self.api_key:
             self._client = genai.Client(api_key=self.api_key)
@@ -775,12 +775,12 @@ class GeminiLiveClient:
 
         # Build configuration with context window compression
         config = types.LiveConnectConfig(
-            responseModalities=[types.Modality.AUDIO],
-            systemInstruction=self.system_instruction,
-            contextWindowCompression=types.ContextWindowCompressionConfig(
+            response_modalities=[types.Modality.AUDIO],
+            system_instruction=self.system_instruction,
+            context_window_compression=types.ContextWindowCompressionConfig(
                 trigger_tokens=8000,  # Trigger compression at 8k tokens
                 sliding_window=types.SlidingWindow(
-                    targetTokens=4000  # Keep last 4k tokens when compressing
+                    target_tokens=4000  # Keep last 4k tokens when compressing
                 ),
             ),
         )
@@ -829,7 +829,7 @@ class GeminiLiveClient:
 
         await self._session.send(input=prompt, end_of_turn=end_of_turn)
 
-    async def send_frame(self, frame: Union[Image.Image, bytes]) -> None:
+    async def send_frame(self, frame: Image.Image | bytes) -> None:
         """
         Send a single video frame to the model.
 
@@ -973,7 +973,7 @@ class GeminiLiveClient:
                                 yield part.inline_data.data
 
     def _extract_frames_from_video(
-        self, video_path: Union[str, Path], fps: float = 1.0
+        self, video_path: str | Path, fps: float = 1.0
     ) -> list[Image.Image]:
         """
         Extract frames from video file using ffmpeg.
@@ -998,7 +998,7 @@ class GeminiLiveClient:
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         video_path = str(video_path)
-        frames = []
+        frames: list[Image.Image] = []
 
         # Create temporary directory for frames
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1030,9 +1030,9 @@ class GeminiLiveClient:
 
     async def stream_video_with_audio_output(
         self,
-        video_source: Union[str, Path, AsyncIterator[Image.Image]],
-        on_audio_chunk: Optional[Callable[[bytes], None]] = None,
-        prompt: Optional[str] = None,
+        video_source: str | Path | AsyncIterator[Image.Image],
+        on_audio_chunk: Callable[[bytes], None] | None = None,
+        prompt: str | None = None,
         fps: float = 1.0,
     ) -> bytes:
         """
@@ -1047,6 +1047,41 @@ class GeminiLiveClient:
         Returns:
             bytes: Complete audio output as WAV file bytes
 
+        Raises:
+            ValueError: If session is not connected
+        """
+        # Collect audio output
+        audio_chunks = []
+        async for audio_chunk in self.stream_audio_from_video(
+            video_source, prompt=prompt, fps=fps
+        ):
+            audio_chunks.append(audio_chunk)
+            if on_audio_chunk:
+                on_audio_chunk(audio_chunk)
+
+        # Convert to WAV format
+        return self._create_wav_from_pcm(b"".join(audio_chunks))
+
+    async def stream_audio_from_video(
+        self,
+        video_source: str | Path | AsyncIterator[Image.Image],
+        prompt: str | None = None,
+        fps: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream video input and yield audio commentary chunks as they arrive.
+
+        Unlike stream_video_with_audio_output, nothing is buffered here, so callers
+        can write each chunk straight to disk and keep memory bounded by chunk size.
+
+        Args:
+            video_source: Path to video file or async iterator of frame images
+            prompt: Optional text prompt to guide the commentary
+            fps: Frames per second to extract from video (default: 1.0)
+
+        Yields:
+            bytes: Audio data chunks in 16-bit PCM format at 24kHz
+
         Raises:
             ValueError: If session is not connected
         """
@@ -1064,24 +1099,17 @@ class GeminiLiveClient:
 
             # Send each frame
             for frame in frames:
-                await self.send_video_frame(frame)
+                await self.send_frame(frame)
                 # Small delay between frames to avoid overwhelming the API
                 await asyncio.sleep(0.1)
         else:
             # Stream frame images
             async for frame in video_source:
-                await self.send_video_frame(frame)
+                await self.send_frame(frame)
                 await asyncio.sleep(0.1)
 
-        # Collect audio output
-        audio_chunks = []
         async for audio_chunk in self.receive_audio_stream():
-            audio_chunks.append(audio_chunk)
-            if on_audio_chunk:
-                on_audio_chunk(audio_chunk)
-
-        # Convert to WAV format
-        return self._create_wav_from_pcm(b"".join(audio_chunks))
+            yield audio_chunk
 
     def _create_wav_from_pcm(
         self, pcm_data: bytes, sample_rate: int = 24000, channels: int = 1
@@ -1108,7 +1136,7 @@ class GeminiLiveClient:
         return wav_buffer.read()
 
     async def generate_audio_from_video(
-        self, video_path: Union[str, Path], prompt: str
+        self, video_path: str | Path, prompt: str
     ) -> bytes:
         """
         Convenience method to generate audio commentary from a video file.
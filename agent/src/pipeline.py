@@ -17,6 +17,8 @@ from collections import deque
 from pathlib import Path
 from typing import Any, Callable
 
+import orjson
+
 from .stream import stream_and_chunk_video
 
 logger = logging.getLogger(__name__)
@@ -40,6 +42,8 @@ class SlidingWindowPipeline:
         slide_step: int = 3,
         format_selector: str = "best[ext=mp4]/best",
         debug_dir: Path | None = None,
+        snippet_batch_size: int = 1,
+        max_batch_bytes: int = 8 * 1024 * 1024,
     ):
         """
         Initialize the sliding window pipeline.
@@ -50,6 +54,9 @@ class SlidingWindowPipeline:
             slide_step: Number of chunks to slide when no highlight found (default: 3)
             format_selector: yt-dlp format selector for video quality
             debug_dir: Directory to save intermediate debug videos (default: None)
+            snippet_batch_size: Snippet messages to coalesce into one newline-delimited
+                WebSocket frame (default: 1, one message per frame)
+            max_batch_bytes: Flush a partial batch once it reaches this many bytes
         """
         self.base_chunk_duration = base_chunk_duration
         self.window_size = window_size
@@ -57,6 +64,14 @@ class SlidingWindowPipeline:
         self.format_selector = format_selector
         self.debug_dir = debug_dir
         self.debug_window_count = 0
+        self.snippet_batch_size = snippet_batch_size
+        self.max_batch_bytes = max_batch_bytes
+
+        # Serializes WebSocket sends: highlight and live commentary share one
+        # connection, and a header must be immediately followed by its payload.
+        # Created per run, since a lock is bound to the event loop that first
+        # waits on it and the pipeline may be reused across asyncio.run calls
+        self._send_lock: asyncio.Lock | None = None
 
         # Three processing steps
         self.detect_step: Callable[[list[bytes], dict[str, Any]], Any] | None = None
@@ -120,18 +135,47 @@ class SlidingWindowPipeline:
         except Exception as e:
             logger.warning(f"Failed to save debug video {step_name}: {e}")
 
+    async def _send(self, ws: Any, *messages: str | bytes) -> None:
+        """
+        Send one or more messages back to back without blocking the event loop.
+
+        Async send methods are awaited directly; blocking ones run in a worker
+        thread so the producer keeps downloading while a send is in flight.
+        The messages are sent as one unit: no other send from this pipeline
+        can land between them.
+
+        Args:
+            ws: WebSocket-like object with a send method
+            messages: Text or binary messages to send, in order
+        """
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+        async with self._send_lock:
+            if asyncio.iscoroutinefunction(ws.send):
+                for message in messages:
+                    await ws.send(message)
+            else:
+
+                def send_all() -> None:
+                    for message in messages:
+                        ws.send(message)
+
+                await asyncio.to_thread(send_all)
+
     async def _produce_chunks(
         self,
         video_url: str,
         is_live: bool,
-        highlight_queue: asyncio.Queue[bytes | None],
-        live_queue: asyncio.Queue[bytes | None] | None,
+        highlight_queue: asyncio.Queue[bytes | Exception | None],
+        live_queue: asyncio.Queue[bytes | Exception | None] | None,
     ) -> None:
         """
         Producer: Download video chunks and distribute to consumer queues.
 
         Reads chunks from the video stream and puts them into queues for
         independent processing by highlight detection and live commentary pipelines.
+        The stream ends with a None sentinel, or with the exception that stopped
+        the download so consumers can report it.
 
         Args:
             video_url: URL of video to process
@@ -147,6 +191,7 @@ class SlidingWindowPipeline:
             except StopIteration:
                 return (False, None)
 
+        end_of_stream: Exception | None = None
         try:
             # Stream and chunk the video
             iterator = stream_and_chunk_video(
@@ -177,16 +222,18 @@ class SlidingWindowPipeline:
 
         except Exception as e:
             logger.error(f"[Producer] Error: {e}", exc_info=True)
+            end_of_stream = e
 
         finally:
-            # Signal completion by sending None sentinel to both queues concurrently
-            completion_tasks = [highlight_queue.put(None)]
+            # Signal completion (None, or the download error) to both queues
+            completion_tasks = [highlight_queue.put(end_of_stream)]
             if live_queue:
-                completion_tasks.append(live_queue.put(None))
+                completion_tasks.append(live_queue.put(end_of_stream))
             await asyncio.gather(*completion_tasks)
             logger.info("[Producer] Sent completion signals to all queues")
 
-    def _concatenate_chunks(self, chunks: list[bytes]) -> bytes:
+    @staticmethod
+    def _concatenate_chunks(chunks: list[bytes]) -> bytes:
         """
         Concatenate multiple video chunks into a single video file.
 
@@ -275,6 +322,8 @@ class SlidingWindowPipeline:
         create_error_message: Callable[[str, str | None], str],
         enable_live_commentary: bool = False,
         live_commentary_config: dict[str, Any] | None = None,
+        create_snippet_header_message: Callable[[dict[str, Any], int], str]
+        | None = None,
     ) -> None:
         """
         Process a video URL using queue-based architecture for independent pipeline processing.
@@ -296,7 +345,11 @@ class SlidingWindowPipeline:
             create_error_message: Function to create error message JSON
             enable_live_commentary: Whether to enable live commentary generation
             live_commentary_config: Configuration for live commentary (system_instruction, prompt, fps)
+            create_snippet_header_message: Function to create the JSON header sent before
+                each snippet's raw bytes; when set, snippets go out as binary frames
+                instead of base64 JSON
         """
+        self._send_lock = asyncio.Lock()
         try:
             stream_type = "live stream" if is_live else "video"
             pipelines_enabled = []
@@ -312,8 +365,10 @@ class SlidingWindowPipeline:
             )
 
             # Create queues for independent pipeline processing
-            highlight_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=20)
-            live_queue: asyncio.Queue[bytes | None] | None = None
+            highlight_queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(
+                maxsize=20
+            )
+            live_queue: asyncio.Queue[bytes | Exception | None] | None = None
 
             if enable_live_commentary:
                 live_queue = asyncio.Queue(maxsize=20)
@@ -338,6 +393,7 @@ class SlidingWindowPipeline:
                     create_snippet_message=create_snippet_message,
                     create_complete_message=create_complete_message,
                     create_error_message=create_error_message,
+                    create_snippet_header_message=create_snippet_header_message,
                 ),
                 name="highlight_detection",
             )
@@ -387,16 +443,18 @@ class SlidingWindowPipeline:
 
         except Exception as e:
             logger.error(f"Pipeline error: {e}", exc_info=True)
-            await asyncio.to_thread(ws.send, create_error_message(str(e), video_url))
+            await self._send(ws, create_error_message(str(e), video_url))
 
     async def _process_highlights_from_queue(
         self,
-        queue: asyncio.Queue[bytes | None],
+        queue: asyncio.Queue[bytes | Exception | None],
         video_url: str,
         ws: Any,
         create_snippet_message: Callable[[bytes, str, str, str], str],
         create_complete_message: Callable[[str], str],
         create_error_message: Callable[[str, str | None], str],
+        create_snippet_header_message: Callable[[dict[str, Any], int], str]
+        | None = None,
     ) -> None:
         """
         Consumer: Process chunks from queue for highlight detection using sliding window.
@@ -408,7 +466,22 @@ class SlidingWindowPipeline:
             create_snippet_message: Function to create snippet message JSON
             create_complete_message: Function to create completion message JSON
             create_error_message: Function to create error message JSON
+            create_snippet_header_message: Function to create the header for binary snippets
         """
+        # Snippets waiting to be sent together in one frame
+        pending_snippets: list[str] = []
+        pending_bytes = 0
+
+        async def flush_snippets() -> None:
+            """Send all pending snippet messages as a single newline-delimited frame."""
+            nonlocal pending_bytes
+            if not pending_snippets:
+                return
+            batch = "\n".join(pending_snippets)
+            pending_snippets.clear()
+            pending_bytes = 0
+            await self._send(ws, batch)
+
         try:
             logger.info("[Highlight Detection] Starting pipeline...")
 
@@ -428,6 +501,8 @@ class SlidingWindowPipeline:
                 if chunk_data is None:
                     logger.info("[Highlight Detection] Received completion signal")
                     break
+                if isinstance(chunk_data, Exception):
+                    raise chunk_data
 
                 # Add chunk to cache
                 chunk_cache.append(chunk_data)
@@ -574,11 +649,30 @@ class SlidingWindowPipeline:
                         trimmed_video, "4_final_output", self.debug_window_count
                     )
 
-                    # Send the highlight
-                    snippet_msg = create_snippet_message(
-                        trimmed_video, video_url, title, description
-                    )
-                    await asyncio.to_thread(ws.send, snippet_msg)
+                    if create_snippet_header_message is not None:
+                        # Binary mode: JSON header frame, then the raw MP4 bytes
+                        await flush_snippets()
+                        header_msg = create_snippet_header_message(
+                            {
+                                "src_video_url": video_url,
+                                "title": title,
+                                "description": description,
+                            },
+                            len(trimmed_video),
+                        )
+                        await self._send(ws, header_msg, trimmed_video)
+                    else:
+                        # Queue the highlight, sending once the batch is full
+                        snippet_msg = create_snippet_message(
+                            trimmed_video, video_url, title, description
+                        )
+                        pending_snippets.append(snippet_msg)
+                        pending_bytes += len(snippet_msg)
+                        if (
+                            len(pending_snippets) >= self.snippet_batch_size
+                            or pending_bytes >= self.max_batch_bytes
+                        ):
+                            await flush_snippets()
 
                     highlight_count += 1
                     logger.info(
@@ -601,19 +695,27 @@ class SlidingWindowPipeline:
                         f"[Highlight Detection] Sliding by {self.slide_step} chunks"
                     )
 
-            # Send completion message
-            await asyncio.to_thread(ws.send, create_complete_message(video_url))
+            # Send any partial batch, then the completion message
+            await flush_snippets()
+            await self._send(ws, create_complete_message(video_url))
             logger.info(
                 f"[Highlight Detection] Complete! Total highlights: {highlight_count}, Total chunks: {total_chunks_received}"
             )
 
         except Exception as e:
             logger.error(f"[Highlight Detection] Error: {e}", exc_info=True)
-            await asyncio.to_thread(ws.send, create_error_message(str(e), video_url))
+            try:
+                await flush_snippets()
+            except Exception:
+                # Only the send can fail here, so the connection itself is
+                # broken and the error report below couldn't be delivered either
+                logger.error("[Highlight Detection] Could not send pending snippets")
+                raise
+            await self._send(ws, create_error_message(str(e), video_url))
 
     async def _process_live_commentary_from_queue(
         self,
-        queue: asyncio.Queue[bytes | None],
+        queue: asyncio.Queue[bytes | Exception | None],
         video_url: str,
         ws: Any,
         system_instruction: str,
@@ -642,7 +744,6 @@ class SlidingWindowPipeline:
             fps: Not used anymore (kept for backward compatibility)
         """
         import base64
-        import json
 
         from .live import create_fragmented_mp4, stitch_audio_video
         from .steps import narrate_video_step, speak_text_step
@@ -786,7 +887,7 @@ class SlidingWindowPipeline:
                 )
 
                 # Step 5: Send complete package through websockets
-                message = json.dumps(
+                message = orjson.dumps(
                     {
                         "type": "live_commentary_chunk",
                         "data": {
@@ -807,16 +908,10 @@ class SlidingWindowPipeline:
                             },
                         },
                     }
-                )
+                ).decode()
 
                 # Send through websocket (handle both sync and async send methods)
-                if hasattr(ws, "send"):
-                    if asyncio.iscoroutinefunction(ws.send):
-                        await ws.send(message)
-                    else:
-                        await asyncio.to_thread(ws.send, message)
-                else:
-                    await asyncio.to_thread(ws.send, message)
+                await self._send(ws, message)
 
                 logger.info(
                     f"[Live Commentary] ✓ Successfully sent chunk {chunk_number} with narration"
@@ -847,8 +942,8 @@ class SlidingWindowPipeline:
                 # Read next chunk from queue
                 chunk_data = await queue.get()
 
-                if chunk_data is None:
-                    # End of stream - process any remaining buffered chunk if available
+                if chunk_data is None or isinstance(chunk_data, Exception):
+                    # End of stream (the highlight consumer reports download errors) - process any remaining buffered chunk if available
                     if chunk_buffer:
                         logger.info(
                             "[Live Commentary] Processing final buffered chunk (4 seconds only)"
@@ -907,6 +1002,7 @@ def create_highlight_pipeline(
     window_size: int = 9,
     slide_step: int = 3,
     debug_dir: Path | None = None,
+    snippet_batch_size: int = 1,
 ) -> SlidingWindowPipeline:
     """
     Create a sliding window pipeline configured for highlight detection.
@@ -922,6 +1018,7 @@ def create_highlight_pipeline(
         window_size: Number of chunks per window (default: 9)
         slide_step: Chunks to slide when no highlight (default: 3)
         debug_dir: Directory to save intermediate debug videos (default: None)
+        snippet_batch_size: Snippet messages coalesced per WebSocket frame (default: 1)
 
     Returns:
         Configured SlidingWindowPipeline instance
@@ -937,6 +1034,7 @@ def create_highlight_pipeline(
         window_size=window_size,
         slide_step=slide_step,
         debug_dir=debug_dir,
+        snippet_batch_size=snippet_batch_size,
     )
 
     # Set up the three processing steps
@@ -1,13 +1,304 @@
+import asyncio
+import atexit
+import contextlib
+import errno
+import io
+import json
 import logging
+import os
+import queue
 import shlex
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator
+from typing import IO, Any, Generator, Literal, cast, overload
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from yt_dlp import YoutubeDL
 
 logger = logging.getLogger(__name__)
 
+# Kernel buffer for the pipes carrying video bytes out of yt-dlp (Linux default
+# is 64KB); a larger pipe means fewer context switches between the processes
+_PIPE_SIZE = 1 << 20
+
+# stream_video_chunks starts with small reads so the first bytes arrive
+# quickly, then doubles the read size (up to chunk_size) while full reads keep
+# completing within _FAST_READ_NS, i.e. while yt-dlp is producing faster than
+# we consume
+_MIN_READ_SIZE = 16 * 1024
+_FAST_READ_NS = 5_000_000
+
+# How much of a child's stderr to keep for error messages (most recent reads)
+_STDERR_TAIL_READS = 16
+
+# is_live_stream costs a yt-dlp network round trip, so answers are cached per
+# URL; the TTL bounds how stale a status (e.g. upcoming -> live) can get
+_LIVE_STATUS_TTL = 300.0
+_LIVE_STATUS_CACHE_SIZE = 1024
+_live_status_cache: dict[str, tuple[float, bool]] = {}
+_live_status_lock = threading.Lock()
+
+# yt-dlp passes a single-file VOD through as-is, and an MP4 with its index
+# (moov) at the end can't be demuxed from a pipe. Letting yt-dlp's ffmpeg
+# download it (with range requests) and remux to fragmented MP4 makes any
+# source streamable into the segmenter.
+_STREAMABLE_VOD_OPTIONS = (
+    "--downloader",
+    "ffmpeg",
+    "--downloader-args",
+    "ffmpeg_o:-f mp4 -movflags frag_keyframe+empty_moov",
+)
+
+# How long a child gets to exit after SIGTERM, then after SIGKILL
+_TERMINATE_TIMEOUT = 2.0
+_KILL_TIMEOUT = 5.0
+
+# How often a prefetch thread blocked on a full queue checks whether the
+# consumer has gone away
+_PREFETCH_PUT_TIMEOUT = 0.1
+
+# Arguments shared by every yt-dlp run that writes a video to stdout: output
+# to stdout, no progress/warnings, and no .part files that could collide
+_YTDLP_STDOUT_ARGS = ("-o", "-", "--quiet", "--no-warnings", "--no-part")
+
+# Size classes (powers of two) for stream_video_chunks' read buffers. A buffer
+# is allocated at the smallest class that fits chunk_size and, once its stream
+# ends, kept for the next stream of that class; larger sizes aren't pooled
+_BUFFER_SIZE_CLASSES = tuple(16 * 1024 << i for i in range(7))  # 16KB..1MB
+_BUFFER_POOL_DEPTH = 8
+
+# Buffers stream_video_chunks cycles through with zero_copy=True; a yielded
+# view stays valid until this many more chunks have been read
+_ZERO_COPY_BUFFERS = 8
+
+# Emptied yt-dlp cache directories kept for reuse by later downloads
+_CACHE_DIR_POOL_SIZE = 8
+
+# Live streams need a format with both video and audio
+_LIVE_FORMAT_SELECTOR = "bestvideo+bestaudio/best"
+
+# HLS formats ffmpeg can fetch on its own, without yt-dlp in between
+_HLS_PROTOCOLS = frozenset({"m3u8", "m3u8_native"})
+
+# Finished VOD chunk files each stream reads ahead of its consumer
+_CHUNK_READ_WORKERS = 4
+
+# Thread pool shared by every stream's chunk reads, started on first use so
+# streams don't each spin up (and tear down) their own threads
+_chunk_read_pool: ThreadPoolExecutor | None = None
+_chunk_read_pool_lock = threading.Lock()
+
+# Working directories for downloads and chunking all live under one
+# per-process root, created on first use and deleted by remove_temp_root()
+_temp_root: str | None = None
+_temp_root_lock = threading.Lock()
+
+# Query parameters that don't change which video a URL points at
+_IGNORED_QUERY_PARAMS = frozenset({"t", "si", "feature"})
+
+
+class _StderrTail:
+    """
+    Drain a child process's stderr on a daemon thread.
+
+    Nothing reads stderr while video is streaming, so a chatty child would
+    fill the pipe and block mid-download. Reading it continuously avoids
+    that; only the last few reads are kept, for error messages.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self._reads: deque[bytes] = deque(maxlen=_STDERR_TAIL_READS)
+        self._thread = threading.Thread(target=self._drain, args=(stream,), daemon=True)
+        self._thread.start()
+
+    def _drain(self, stream: IO[bytes]) -> None:
+        # Popen's pipes are buffered readers; read1 returns whatever is there
+        reader = cast(io.BufferedIOBase, stream)
+        try:
+            while data := reader.read1(65536):
+                self._reads.append(data)
+        except (OSError, ValueError):
+            # Pipe closed underneath us; keep what was already read
+            pass
+
+    def text(self, timeout: float = 5.0) -> str:
+        """Return the captured output, waiting briefly for the child to close stderr."""
+        self._thread.join(timeout)
+        return b"".join(self._reads).decode("utf-8", errors="replace")
+
+
+class _AdaptiveReadSize:
+    """
+    Pick the size of the next pipe read from how the previous one went.
+
+    Starts at _MIN_READ_SIZE and doubles after every read that filled its
+    buffer within _FAST_READ_NS, up to `limit`; halves after a short read.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.floor = min(_MIN_READ_SIZE, limit)
+        self.size = self.floor
+
+    def update(self, n: int, elapsed_ns: int) -> None:
+        """Record that a read of `self.size` bytes returned `n` after `elapsed_ns`."""
+        if n >= self.size:
+            if elapsed_ns < _FAST_READ_NS:
+                self.size = min(self.size * 2, self.limit)
+        else:
+            self.size = max(self.size // 2, self.floor)
+
+
+_buffer_pools: dict[int, queue.LifoQueue[bytearray]] = {
+    size: queue.LifoQueue(maxsize=_BUFFER_POOL_DEPTH) for size in _BUFFER_SIZE_CLASSES
+}
+
+
+def _acquire_buffer(size: int) -> bytearray:
+    """Get a read buffer of at least `size` bytes, reusing a pooled one if free."""
+    size_class = next((c for c in _BUFFER_SIZE_CLASSES if c >= size), None)
+    if size_class is None:
+        return bytearray(size)
+    try:
+        return _buffer_pools[size_class].get_nowait()
+    except queue.Empty:
+        return bytearray(size_class)
+
+
+def _release_buffer(buffer: bytearray) -> None:
+    """Return a buffer from _acquire_buffer to its size-class pool."""
+    pool = _buffer_pools.get(len(buffer))
+    if pool is not None:
+        try:
+            pool.put_nowait(buffer)
+        except queue.Full:
+            pass
+
+
+def _get_temp_root() -> str:
+    """Return this process's working-directory root, creating it if needed."""
+    global _temp_root
+    with _temp_root_lock:
+        if _temp_root is None:
+            _temp_root = tempfile.mkdtemp(prefix="sportsclips_")
+        else:
+            # Recreate the root if something (e.g. a tmp cleaner) removed it
+            os.makedirs(_temp_root, exist_ok=True)
+        return _temp_root
+
+
+def remove_temp_root() -> None:
+    """
+    Delete this process's working-directory root and everything under it.
+
+    Runs at interpreter exit. Processes that may not get there (e.g. a
+    forked child leaving via os._exit) should call it themselves. A later
+    run simply creates a new root.
+    """
+    global _temp_root
+    with _temp_root_lock:
+        root, _temp_root = _temp_root, None
+    if root is not None:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+atexit.register(remove_temp_root)
+
+
+def _alloc_tmpdir(prefix: str) -> str:
+    """Create a private working directory for one run under the temp root."""
+    return tempfile.mkdtemp(prefix=prefix, dir=_get_temp_root())
+
+
+class _WorkdirPool:
+    """
+    Hand out empty private directories, reusing ones from finished runs.
+
+    A directory belongs to one run between acquire() and release(), so
+    concurrent runs never share one; release() empties it and keeps it for
+    the next run instead of deleting and recreating the directory itself.
+    """
+
+    def __init__(self, prefix: str, size: int):
+        self._prefix = prefix
+        self._free: queue.Queue[str] = queue.Queue(maxsize=size)
+
+    def acquire(self) -> str:
+        """Take an empty directory from the pool, creating one if none is free."""
+        while True:
+            try:
+                path = self._free.get_nowait()
+            except queue.Empty:
+                return _alloc_tmpdir(self._prefix)
+            # Skip directories something else removed while they sat in the pool
+            if os.path.isdir(path):
+                return path
+
+    def release(self, path: str) -> None:
+        """Empty a directory and return it to the pool (or delete it if full)."""
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            self._free.put_nowait(path)
+        except (OSError, queue.Full):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# Per-download yt-dlp cache directories
+_cache_dirs = _WorkdirPool("ytdlp_cache_", _CACHE_DIR_POOL_SIZE)
+
+
+def _stop_process(process: subprocess.Popen[bytes]) -> None:
+    """
+    Stop a running child without blocking on it indefinitely.
+
+    The child gets SIGTERM first so it can shut down cleanly, and SIGKILL
+    only if it hasn't exited after _TERMINATE_TIMEOUT seconds.
+    """
+    process.terminate()
+    try:
+        process.wait(timeout=_TERMINATE_TIMEOUT)
+        return
+    except subprocess.TimeoutExpired:
+        process.kill()
+    try:
+        process.wait(timeout=_KILL_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"Process {process.pid} did not exit after SIGKILL")
+
+
+async def _stop_process_async(process: asyncio.subprocess.Process) -> None:
+    """Async counterpart of _stop_process: SIGTERM, then SIGKILL if it lingers."""
+    try:
+        process.terminate()
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), _TERMINATE_TIMEOUT)
+        return
+    except TimeoutError:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            # It exited between the timeout and the kill
+            return
+    try:
+        await asyncio.wait_for(process.wait(), _KILL_TIMEOUT)
+    except TimeoutError:
+        logger.warning(f"Process {process.pid} did not exit after SIGKILL")
+
 
 def get_cookies_path() -> str | None:
     """
@@ -26,6 +317,315 @@ def get_cookies_path() -> str | None:
     return None
 
 
+def _canonical_video_url(url: str) -> str:
+    """Drop tracking/timestamp query parameters and the fragment from a URL."""
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _IGNORED_QUERY_PARAMS and not key.startswith("utm_")
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query), fragment=""))
+
+
+def _ytdlp_info_options() -> dict[str, object]:
+    """Options for an in-process yt-dlp that only extracts video info."""
+    options: dict[str, object] = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "simulate": True,
+        "noplaylist": True,
+        "cachedir": False,  # No shared cache, so concurrent checks can't collide
+        "socket_timeout": 60,
+        "logger": logger,
+    }
+    cookies_path = get_cookies_path()
+    if cookies_path:
+        options["cookiefile"] = cookies_path
+    return options
+
+
+def clear_live_status_cache() -> None:
+    """Forget all cached is_live_stream results."""
+    with _live_status_lock:
+        _live_status_cache.clear()
+
+
+def is_live_stream(url: str) -> bool:
+    """
+    Check whether a URL points at a live (or upcoming) stream using yt-dlp.
+
+    Successful checks are cached per canonical URL for _LIVE_STATUS_TTL
+    seconds; failures are not cached so a transient error can be retried.
+
+    Args:
+        url: The video URL to check
+
+    Returns:
+        bool: True if the video is live or an upcoming live stream, False if it
+              is not live or the check failed
+    """
+    key = _canonical_video_url(url)
+    with _live_status_lock:
+        cached = _live_status_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _LIVE_STATUS_TTL:
+        return cached[1]
+
+    # Ask yt-dlp in-process: no interpreter startup or JSON round trip per check
+    try:
+        with YoutubeDL(_ytdlp_info_options()) as ydl:
+            info = ydl.extract_info(url, download=False)
+    except Exception as e:
+        logger.warning(f"Could not check live status of {url}: {e}")
+        return False
+    if not isinstance(info, dict):
+        logger.warning(f"Could not check live status of {url}: no video info")
+        return False
+
+    is_live = bool(info.get("is_live")) or info.get("live_status") in (
+        "is_live",
+        "is_upcoming",
+    )
+
+    with _live_status_lock:
+        if key not in _live_status_cache and (
+            len(_live_status_cache) >= _LIVE_STATUS_CACHE_SIZE
+        ):
+            # Evict the oldest entry (dicts keep insertion order)
+            del _live_status_cache[next(iter(_live_status_cache))]
+        _live_status_cache[key] = (time.monotonic(), is_live)
+    return is_live
+
+
+def _hls_input_args(ydl: YoutubeDL, info: dict[str, Any]) -> list[str] | None:
+    """
+    ffmpeg input options for reading the selected format directly.
+
+    Carries the HTTP headers and cookies yt-dlp would send. None if the
+    format isn't a single muxed HLS stream, which has to go through yt-dlp.
+    """
+    # Separate video and audio formats come back as requested_formats
+    if info.get("requested_formats"):
+        return None
+    if info.get("protocol") not in _HLS_PROTOCOLS or not info.get("url"):
+        return None
+
+    input_args: list[str] = []
+    if http_headers := info.get("http_headers"):
+        headers = "".join(f"{k}: {v}\r\n" for k, v in http_headers.items())
+        input_args += ["-headers", headers]
+    if cookies := ydl.cookiejar.get_cookies_for_url(info["url"]):
+        # Same cookie format yt-dlp uses when it hands a download to ffmpeg
+        input_args += [
+            "-cookies",
+            "".join(
+                f"{c.name}={c.value}; path={c.path}; domain={c.domain};\r\n"
+                for c in cookies
+            ),
+        ]
+    return [*input_args, "-i", info["url"]]
+
+
+def _resolve_stream(
+    url: str, format_selector: str
+) -> tuple[dict[str, Any], list[str] | None] | None:
+    """
+    Resolve a stream with yt-dlp once, for whichever reader then streams it.
+
+    Returns the JSON-safe info dict, which the yt-dlp pipe loads with
+    --load-info-json instead of resolving the stream again, and ffmpeg input
+    options if ffmpeg can read the selected format itself (else None).
+    Returns None if resolving failed.
+    """
+    options = _ytdlp_info_options()
+    options["format"] = format_selector
+    try:
+        with YoutubeDL(options) as ydl:
+            info = ydl.extract_info(url, download=False)
+            if not isinstance(info, dict):
+                return None
+            return ydl.sanitize_info(info), _hls_input_args(ydl, info)
+    except Exception as e:
+        logger.debug(f"Could not resolve {url}: {e}")
+        return None
+
+
+class _UnstreamableSourceError(RuntimeError):
+    """ffmpeg read the piped source to the end without finding a single sample."""
+
+
+def _read_segment_list(segment_list: Path) -> list[str]:
+    """Read the chunk file names ffmpeg wrote to a flat segment list, in order."""
+    try:
+        text = segment_list.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise RuntimeError(f"ffmpeg did not write its segment list {segment_list}")
+    return [name for name in text.splitlines() if name]
+
+
+def _segment_stream(
+    temp_path: Path,
+    chunk_duration: int,
+    mode: str,
+    ytdlp_cmd: list[str] | None = None,
+    input_args: list[str] | None = None,
+) -> Generator[bytes, None, None]:
+    """
+    Run an ffmpeg segmenter and yield each chunk as soon as ffmpeg has
+    finished writing it.
+
+    ffmpeg reads either yt-dlp's stdout (ytdlp_cmd) or, when the source is
+    something it can fetch itself, its own input (input_args).
+
+    Args:
+        temp_path: Working directory for the chunk files and segment list
+        chunk_duration: Duration of each chunk in seconds
+        mode: Label for log messages ("live" or "VOD")
+        ytdlp_cmd: yt-dlp command that writes the video to stdout
+        input_args: ffmpeg input options, used instead of a yt-dlp pipe
+
+    Yields:
+        bytes: Video chunk data (complete MP4 files)
+    """
+    # Build ffmpeg command to chunk the stream in real-time
+    # Use relative paths so ffmpeg writes all files within temp_path
+    output_pattern = "chunk_%05d.mp4"
+    ffmpeg_cmd = [
+        "ffmpeg",
+        *(input_args or ["-i", "pipe:0"]),  # Read from stdin by default
+        "-c:v",
+        "copy",  # Copy video without re-encoding
+        "-c:a",
+        "copy",  # Copy audio without re-encoding
+        "-map",
+        "0:v?",  # Map video stream if present
+        "-map",
+        "0:a?",  # Map audio stream if present
+        "-f",
+        "segment",
+        "-segment_time",
+        str(chunk_duration),
+        "-segment_format",
+        "mp4",
+        "-reset_timestamps",
+        "1",
+        "-strftime",
+        "0",
+        "-segment_list",
+        "pipe:1",  # Announce each finished segment on stdout
+        "-segment_list_type",
+        "csv",  # name,start,end per segment
+        "-segment_list_flags",
+        "live",
+        output_pattern,
+    ]
+
+    # Log commands for reproduction/debugging
+    try:
+        if ytdlp_cmd:
+            logger.debug(
+                "yt-dlp command (%s): %s",
+                mode,
+                " ".join(shlex.quote(arg) for arg in ytdlp_cmd),
+            )
+        logger.debug(
+            "ffmpeg command (%s): %s",
+            mode,
+            " ".join(shlex.quote(arg) for arg in ffmpeg_cmd),
+        )
+    except Exception:
+        pass
+
+    ytdlp_process = None
+    ytdlp_stderr = None
+    if ytdlp_cmd:
+        # Start yt-dlp process
+        # Use temp_path as cwd to prevent -Frag files from appearing in project directory
+        ytdlp_process = subprocess.Popen(
+            ytdlp_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=temp_path,
+            pipesize=_PIPE_SIZE,
+        )
+
+    # Start ffmpeg process, reading from yt-dlp's output if there is one
+    # Use temp_path as cwd to prevent -Frag files from conflicting in concurrent operations
+    ffmpeg_process = subprocess.Popen(
+        ffmpeg_cmd,
+        stdin=ytdlp_process.stdout if ytdlp_process else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=temp_path,
+    )
+
+    if ytdlp_process:
+        # Close yt-dlp stdout in parent to allow proper pipe behavior
+        if ytdlp_process.stdout:
+            ytdlp_process.stdout.close()
+        ytdlp_stderr = (
+            _StderrTail(ytdlp_process.stderr) if ytdlp_process.stderr else None
+        )
+
+    # Keep stderr pipes drained so no process blocks on them
+    ffmpeg_stderr = (
+        _StderrTail(ffmpeg_process.stderr) if ffmpeg_process.stderr else None
+    )
+    processes = [p for p in (ffmpeg_process, ytdlp_process) if p is not None]
+
+    # ffmpeg prints a segment's entry only once it has finished writing it,
+    # so each line read from its stdout is a complete chunk, delivered as
+    # soon as it exists without polling the directory or a list file
+    chunks_yielded = 0
+    empty_segments = 0
+    try:
+        if ffmpeg_process.stdout:
+            for line in ffmpeg_process.stdout:
+                entry = line.strip().decode("utf-8")
+                if not entry:
+                    continue
+                segment_name, start, end = entry.rsplit(",", 2)
+                if float(end) <= float(start):
+                    # A segment with no duration holds no samples, only the MP4
+                    # header ffmpeg writes for an input it couldn't demux
+                    logger.warning(
+                        f"Skipping segment {segment_name} ({mode}): it has no samples"
+                    )
+                    empty_segments += 1
+                    _read_chunk_file(temp_path / segment_name)
+                    continue
+                # If we can't read the chunk, it comes back empty and is skipped
+                chunk_data = _read_chunk_file(temp_path / segment_name)
+                if chunk_data:
+                    chunks_yielded += 1
+                    yield chunk_data
+
+        # ffmpeg closed its stdout, so both processes are finishing
+        ffmpeg_status = ffmpeg_process.wait()
+        ytdlp_status = ytdlp_process.wait() if ytdlp_process else 0
+    finally:
+        # If the consumer stopped early, don't leave the children running
+        for process in processes:
+            if process.returncode is None:
+                _stop_process(process)
+
+    # Check for errors
+    if ytdlp_status != 0:
+        stderr = ytdlp_stderr.text() if ytdlp_stderr else ""
+        raise RuntimeError(f"yt-dlp failed with return code {ytdlp_status}: {stderr}")
+
+    if ffmpeg_status != 0:
+        stderr = ffmpeg_stderr.text() if ffmpeg_stderr else ""
+        raise RuntimeError(f"ffmpeg failed with return code {ffmpeg_status}: {stderr}")
+
+    if empty_segments and not chunks_yielded:
+        stderr = ffmpeg_stderr.text() if ffmpeg_stderr else ""
+        raise _UnstreamableSourceError(
+            f"ffmpeg found no samples in the input: {stderr}"
+        )
+
+
 def stream_and_chunk_live(
     url: str,
     chunk_duration: int = 15,
@@ -51,216 +651,136 @@ def stream_and_chunk_live(
     """
     # Create unique temp directory with UUID to avoid collisions
     unique_id = uuid.uuid4().hex[:8]
-    temp_dir = tempfile.mkdtemp(prefix=f"live_stream_{unique_id}_")
+    temp_dir = _alloc_tmpdir(f"live_stream_{unique_id}_")
 
     try:
         temp_path = Path(temp_dir)
 
-        # Ensure base temp directory exists (handles mocked mkdtemp in tests)
+        # Ensure base temp directory exists (handles a mocked _alloc_tmpdir in tests)
         temp_path.mkdir(parents=True, exist_ok=True)
 
         # Create isolated cache directory for this yt-dlp instance
         cache_dir = temp_path / "yt-dlp-cache"
         cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Build yt-dlp command to stream from live edge (not from start)
-        ytdlp_cmd = [
-            "yt-dlp",
-            "--no-live-from-start",  # Stream from live edge (current point), not from beginning
-            "-o",
-            "-",  # Output to stdout
-            "--quiet",
-            "--no-warnings",
-            "--cache-dir",
-            str(cache_dir),  # Use isolated cache directory
-            "--no-part",  # Don't use .part files to avoid collisions
-        ]
-
-        # Add cookies if available
-        cookies_path = get_cookies_path()
-        if cookies_path:
-            ytdlp_cmd.extend(["--cookies", cookies_path])
-
         # Always add format selector to ensure audio is included
         # Use format that includes both video and audio; avoid VOD-only selectors
-        live_default = "bestvideo+bestaudio/best"
-        if format_selector:
-            if "ext=mp4" in format_selector and "+" not in format_selector:
-                logger.info(
-                    "Ignoring VOD-only format selector for live stream; using a live-safe selector"
-                )
-                ytdlp_cmd.extend(["-f", live_default])
-            else:
-                ytdlp_cmd.extend(["-f", format_selector])
-        else:
-            ytdlp_cmd.extend(["-f", live_default])
-
-        if additional_options:
-            ytdlp_cmd.extend(additional_options)
+        selector = format_selector or _LIVE_FORMAT_SELECTOR
+        if "ext=mp4" in selector and "+" not in selector:
+            logger.info(
+                "Ignoring VOD-only format selector for live stream; using a live-safe selector"
+            )
+            selector = _LIVE_FORMAT_SELECTOR
+
+        # Resolve the stream once; both readers below use the result instead
+        # of asking the site again. Extra yt-dlp options only apply to the
+        # yt-dlp pipe, so leave resolving to it when any are given.
+        resolved = None if additional_options else _resolve_stream(url, selector)
+        if resolved and resolved[1]:
+            # A muxed HLS stream can be read by ffmpeg itself, which saves
+            # running yt-dlp for the whole stream
+            yield from _segment_stream(
+                temp_path, chunk_duration, "live", input_args=resolved[1]
+            )
+            return
 
-        ytdlp_cmd.append(url)
+        info_json = None
+        if resolved:
+            info_json = temp_path / "info.json"
+            info_json.write_text(json.dumps(resolved[0]))
 
-        # Build ffmpeg command to chunk the stream in real-time
-        # Use relative paths so ffmpeg writes all files within temp_dir
-        output_pattern = "chunk_%05d.mp4"
-        segments_file = "segments.txt"
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-i",
-            "pipe:0",  # Read from stdin
-            "-c:v",
-            "copy",  # Copy video without re-encoding
-            "-c:a",
-            "copy",  # Copy audio without re-encoding
-            "-map",
-            "0:v?",  # Map video stream if present
-            "-map",
-            "0:a?",  # Map audio stream if present
-            "-f",
-            "segment",
-            "-segment_time",
-            str(chunk_duration),
-            "-segment_format",
-            "mp4",
-            "-reset_timestamps",
-            "1",
-            "-strftime",
-            "0",
-            "-segment_list",
-            segments_file,
-            "-segment_list_flags",
-            "live",
-            output_pattern,
-        ]
+        # Stream from live edge (current point), not from beginning
+        ytdlp_cmd = _build_ytdlp_command(
+            url,
+            selector,
+            additional_options,
+            live_from_start=False,
+            cache_dir=str(cache_dir),
+            info_json=str(info_json) if info_json else None,
+        )
+        yield from _segment_stream(
+            temp_path, chunk_duration, "live", ytdlp_cmd=ytdlp_cmd
+        )
 
-        # Log commands for reproduction/debugging
+    finally:
+        # Cleanup
         try:
-            logger.debug(
-                "yt-dlp command (live): %s",
-                " ".join(shlex.quote(arg) for arg in ytdlp_cmd),
-            )
-            logger.debug(
-                "ffmpeg command (live): %s",
-                " ".join(shlex.quote(arg) for arg in ffmpeg_cmd),
-            )
+            shutil.rmtree(temp_dir)
         except Exception:
             pass
 
-        # Start yt-dlp process
-        # Use temp_dir as cwd to prevent -Frag files from appearing in project directory
-        ytdlp_process = subprocess.Popen(
-            ytdlp_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=temp_dir,
-        )
 
-        # Start ffmpeg process, reading from yt-dlp's output
-        # Use temp_dir as cwd to prevent -Frag files from conflicting in concurrent operations
-        ffmpeg_process = subprocess.Popen(
-            ffmpeg_cmd,
-            stdin=ytdlp_process.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=temp_dir,
-        )
+def _build_ytdlp_command(
+    url: str,
+    format_selector: str,
+    additional_options: list[str] | None,
+    live_from_start: bool,
+    cache_dir: str,
+    info_json: str | None = None,
+) -> list[str]:
+    """
+    Build the yt-dlp command that writes a single video to stdout.
 
-        # Close yt-dlp stdout in parent to allow proper pipe behavior
-        if ytdlp_process.stdout:
-            ytdlp_process.stdout.close()
+    With info_json, yt-dlp loads the already resolved stream from that file
+    instead of resolving the URL again.
+    """
+    cookies_path = get_cookies_path()
+
+    # Note: --hls-use-mpegts can cause audio issues when streaming to stdout
+    # because MPEG-TS muxing may not properly include audio streams.
+    # Removed to ensure audio is included in the output.
+
+    # Built as one list display so each call allocates only the final argv
+    return [
+        "yt-dlp",
+        "-f",
+        format_selector,
+        *_YTDLP_STDOUT_ARGS,
+        "--cache-dir",
+        cache_dir,  # Use isolated cache directory
+        # Add cookies if available
+        *(("--cookies", cookies_path) if cookies_path else ()),
+        # Live streams jump to the live edge unless asked to start from the beginning
+        "--live-from-start" if live_from_start else "--no-live-from-start",
+        # Add any additional options
+        *(additional_options or ()),
+        *(("--load-info-json", info_json) if info_json else (url,)),
+    ]
 
-        # Track which chunks we've already yielded
-        yielded_chunks = set()
 
-        # Keep monitoring for new chunks until the stream ends
-        while True:
-            # Check if processes are still running
-            ytdlp_status = ytdlp_process.poll()
-            ffmpeg_status = ffmpeg_process.poll()
-
-            # Find all chunk files
-            chunk_files = sorted(temp_path.glob("chunk_*.mp4"))
-
-            # Yield any new chunks
-            for chunk_file in chunk_files:
-                if chunk_file not in yielded_chunks:
-                    # Wait a moment to ensure the chunk is complete
-                    # (ffmpeg may still be writing to it)
-                    import time
-
-                    time.sleep(0.5)
-
-                    # Check if this is likely the last/current chunk being written
-                    # by seeing if there's a newer chunk
-                    newer_chunks = [f for f in chunk_files if f > chunk_file]
-                    if newer_chunks or ffmpeg_status is not None:
-                        # This chunk is complete, read and yield it
-                        try:
-                            with open(chunk_file, "rb") as f:
-                                chunk_data = f.read()
-
-                            if chunk_data:
-                                yielded_chunks.add(chunk_file)
-                                yield chunk_data
-                        except Exception:
-                            # If we can't read the chunk, skip it
-                            pass
-
-            # If both processes have ended, yield any remaining chunks and exit
-            if ytdlp_status is not None and ffmpeg_status is not None:
-                # Give ffmpeg a moment to finish writing the last chunk
-                import time
-
-                time.sleep(1)
-
-                # Yield any final chunks
-                final_chunks = sorted(temp_path.glob("chunk_*.mp4"))
-                for chunk_file in final_chunks:
-                    if chunk_file not in yielded_chunks:
-                        try:
-                            with open(chunk_file, "rb") as f:
-                                chunk_data = f.read()
-                            if chunk_data:
-                                yield chunk_data
-                        except Exception:
-                            pass
-
-                break
-
-            # Sleep briefly before checking again
-            import time
-
-            time.sleep(2)
-
-        # Check for errors
-        if ytdlp_status != 0:
-            stderr = (
-                ytdlp_process.stderr.read().decode("utf-8")
-                if ytdlp_process.stderr
-                else ""
-            )
-            raise RuntimeError(
-                f"yt-dlp failed with return code {ytdlp_status}: {stderr}"
-            )
+@overload
+def stream_video_chunks(
+    url: str,
+    chunk_size: int = ...,
+    format_selector: str = ...,
+    additional_options: list[str] | None = ...,
+    live_from_start: bool = ...,
+    zero_copy: Literal[False] = ...,
+) -> Generator[bytes, None, None]: ...
 
-        if ffmpeg_status != 0:
-            stderr = (
-                ffmpeg_process.stderr.read().decode("utf-8")
-                if ffmpeg_process.stderr
-                else ""
-            )
-            raise RuntimeError(
-                f"ffmpeg failed with return code {ffmpeg_status}: {stderr}"
-            )
 
-    finally:
-        # Cleanup
-        try:
-            import shutil
+@overload
+def stream_video_chunks(
+    url: str,
+    chunk_size: int = ...,
+    format_selector: str = ...,
+    additional_options: list[str] | None = ...,
+    live_from_start: bool = ...,
+    *,
+    zero_copy: Literal[True],
+) -> Generator[memoryview, None, None]: ...
 
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
+
+@overload
+def stream_video_chunks(
+    url: str,
+    chunk_size: int = ...,
+    format_selector: str = ...,
+    additional_options: list[str] | None = ...,
+    live_from_start: bool = ...,
+    *,
+    zero_copy: bool,
+) -> Generator[bytes | memoryview, None, None]: ...
 
 
 def stream_video_chunks(
@@ -269,20 +789,27 @@ def stream_video_chunks(
     format_selector: str = "bestvideo+bestaudio/best",
     additional_options: list[str] | None = None,
     live_from_start: bool = False,
-) -> Generator[bytes, None, None]:
+    zero_copy: bool = False,
+) -> Generator[bytes | memoryview, None, None]:
     """
     Stream video chunks from a URL using yt-dlp.
 
     Args:
         url: The video URL to stream from
-        chunk_size: Size of each chunk to yield in bytes (default: 1MB)
+        chunk_size: Largest chunk to yield in bytes (default: 1MB). Reads start
+                    at 16KB for a fast first chunk and grow toward this size
+                    while yt-dlp keeps up
         format_selector: yt-dlp format selector (default: "best")
         additional_options: Additional yt-dlp command-line options
         live_from_start: For live streams, start from beginning instead of live edge.
                         Default False (jumps to live edge for live videos)
+        zero_copy: Yield memoryviews into a small ring of reused buffers instead
+                   of copying each chunk into new bytes. A view is overwritten
+                   once 8 more chunks have been read, so copy anything kept
+                   longer than that. Default False
 
     Yields:
-        bytes: Video data chunks
+        bytes: Video data chunks (memoryview when zero_copy is True)
 
     Example:
         >>> # Stream regular video
@@ -300,45 +827,14 @@ def stream_video_chunks(
         ...     # Gets chunks from beginning of stream
         ...     pass
     """
-    # Create isolated cache directory for this yt-dlp instance
-    temp_cache_dir = tempfile.mkdtemp(prefix=f"ytdlp_cache_{uuid.uuid4().hex[:8]}_")
+    # Take an isolated cache directory for this yt-dlp instance
+    temp_cache_dir = _cache_dirs.acquire()
+    pooled_buffer: bytearray | None = None
 
     try:
-        # Build yt-dlp command
-        cmd = [
-            "yt-dlp",
-            "-f",
-            format_selector,
-            "-o",
-            "-",  # Output to stdout
-            "--quiet",  # Suppress yt-dlp output
-            "--no-warnings",
-            "--cache-dir",
-            temp_cache_dir,  # Use isolated cache directory
-            "--no-part",  # Don't use .part files to avoid collisions
-        ]
-
-        # Add cookies if available
-        cookies_path = get_cookies_path()
-        if cookies_path:
-            cmd.extend(["--cookies", cookies_path])
-
-        # Add live stream handling options
-        if live_from_start:
-            cmd.append("--live-from-start")
-        else:
-            # Default: jump to live edge for live streams
-            cmd.append("--no-live-from-start")
-
-        # Note: --hls-use-mpegts can cause audio issues when streaming to stdout
-        # because MPEG-TS muxing may not properly include audio streams.
-        # Removed to ensure audio is included in the output.
-
-        # Add any additional options
-        if additional_options:
-            cmd.extend(additional_options)
-
-        cmd.append(url)
+        cmd = _build_ytdlp_command(
+            url, format_selector, additional_options, live_from_start, temp_cache_dir
+        )
 
         try:
             # Start yt-dlp process with stdout as pipe
@@ -349,6 +845,7 @@ def stream_video_chunks(
                 stderr=subprocess.PIPE,
                 bufsize=chunk_size,
                 cwd=temp_cache_dir,
+                pipesize=_PIPE_SIZE,
             )
 
             # Ensure stdout is available
@@ -356,18 +853,39 @@ def stream_video_chunks(
                 raise RuntimeError("Failed to open stdout pipe")
             if process.stderr is None:
                 raise RuntimeError("Failed to open stderr pipe")
-
-            # Stream chunks from stdout
+            stderr_tail = _StderrTail(process.stderr)
+            # bufsize > 0 makes Popen wrap the pipe in a BufferedReader
+            stdout = cast(io.BufferedReader, process.stdout)
+
+            # Stream chunks from stdout, reading into reusable buffers so the
+            # only per-chunk allocation is the bytes object handed to the caller
+            # (none at all with zero_copy). Buffers are allocated on first use;
+            # views handed out with zero_copy may outlive this generator, so
+            # only the private buffer of the default mode is pooled.
+            pool_size = _ZERO_COPY_BUFFERS if zero_copy else 1
+            buffers: list[memoryview] = []
+            reads = 0
+            read_size = _AdaptiveReadSize(chunk_size)
             while True:
-                chunk = process.stdout.read(chunk_size)
-                if not chunk:
+                if len(buffers) < pool_size:
+                    if zero_copy:
+                        buffers.append(memoryview(bytearray(chunk_size)))
+                    else:
+                        pooled_buffer = _acquire_buffer(chunk_size)
+                        buffers.append(memoryview(pooled_buffer))
+                buffer = buffers[reads % pool_size][: read_size.size]
+                reads += 1
+                started = time.monotonic_ns()
+                n = stdout.readinto(buffer)
+                if not n:
                     break
-                yield chunk
+                read_size.update(n, time.monotonic_ns() - started)
+                yield buffer[:n] if zero_copy else bytes(buffer[:n])
 
             # Wait for process to complete and check for errors
             process.wait()
             if process.returncode != 0:
-                stderr_output = process.stderr.read().decode("utf-8")
+                stderr_output = stderr_tail.text()
                 raise RuntimeError(
                     f"yt-dlp failed with return code {process.returncode}: {stderr_output}"
                 )
@@ -376,20 +894,334 @@ def stream_video_chunks(
             raise RuntimeError(
                 "yt-dlp is not installed. Install it with: pip install yt-dlp"
             ) from None
-        except Exception:
-            # Clean up process if still running
+        except BaseException:
+            # Clean up process if still running (also when the caller stops early)
             if "process" in locals() and process.poll() is None:
-                process.kill()
-                process.wait()
+                _stop_process(process)
             raise
     finally:
-        # Cleanup isolated cache directory
+        if pooled_buffer is not None:
+            _release_buffer(pooled_buffer)
+        # Empty the isolated cache directory and hand it back for reuse
+        _cache_dirs.release(temp_cache_dir)
+
+
+def _put_unless_stopped(
+    items: queue.Queue[object], item: object, stop: threading.Event
+) -> bool:
+    """Put an item on a bounded queue, giving up once `stop` is set."""
+    while not stop.is_set():
         try:
-            import shutil
+            items.put(item, timeout=_PREFETCH_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
 
-            shutil.rmtree(temp_cache_dir)
-        except Exception:
-            pass
+
+def stream_video_chunks_prefetched(
+    url: str,
+    prefetch: int = 8,
+    chunk_size: int = 1024 * 1024,
+    format_selector: str = "bestvideo+bestaudio/best",
+    additional_options: list[str] | None = None,
+    live_from_start: bool = False,
+) -> Generator[bytes, None, None]:
+    """
+    Stream video chunks like stream_video_chunks, reading ahead of the caller.
+
+    A background thread keeps draining yt-dlp's pipe into a queue of up to
+    `prefetch` chunks, so the download doesn't stall while the caller is busy
+    with the previous chunk. Download errors are re-raised in the caller.
+
+    Args:
+        url: The video URL to stream from
+        prefetch: Maximum number of chunks read ahead (default: 8)
+        chunk_size: Size of each chunk to yield in bytes (default: 1MB)
+        format_selector: yt-dlp format selector
+        additional_options: Additional yt-dlp command-line options
+        live_from_start: For live streams, start from beginning instead of live edge
+
+    Yields:
+        bytes: Video data chunks
+    """
+    items: queue.Queue[object] = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+
+    def produce() -> None:
+        chunks = stream_video_chunks(
+            url,
+            chunk_size=chunk_size,
+            format_selector=format_selector,
+            additional_options=additional_options,
+            live_from_start=live_from_start,
+        )
+        try:
+            for chunk in chunks:
+                if not _put_unless_stopped(items, chunk, stop):
+                    return
+        except Exception as e:
+            _put_unless_stopped(items, e, stop)
+            return
+        finally:
+            chunks.close()
+        _put_unless_stopped(items, done, stop)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if isinstance(item, bytes):
+                yield item
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                return
+    finally:
+        # Let the reader stop at its next chunk if the caller stops early
+        stop.set()
+
+
+async def _drain_stderr_async(stream: asyncio.StreamReader) -> str:
+    """Read a child's stderr to EOF, keeping only the last few reads (see _StderrTail)."""
+    reads: deque[bytes] = deque(maxlen=_STDERR_TAIL_READS)
+    while data := await stream.read(65536):
+        reads.append(data)
+    return b"".join(reads).decode("utf-8", errors="replace")
+
+
+async def stream_video_chunks_async(
+    url: str,
+    chunk_size: int = 1024 * 1024,
+    format_selector: str = "bestvideo+bestaudio/best",
+    additional_options: list[str] | None = None,
+    live_from_start: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Stream video chunks like stream_video_chunks, from inside an event loop.
+
+    yt-dlp's pipes are read by the event loop itself, so any number of
+    concurrent downloads share the loop's thread instead of each blocking a
+    worker thread in read(). Each chunk is whatever yt-dlp has written so far,
+    up to `chunk_size` bytes.
+
+    Args:
+        url: The video URL to stream from
+        chunk_size: Largest chunk to yield in bytes (default: 1MB)
+        format_selector: yt-dlp format selector
+        additional_options: Additional yt-dlp command-line options
+        live_from_start: For live streams, start from beginning instead of live edge
+
+    Yields:
+        bytes: Video data chunks
+
+    Raises:
+        RuntimeError: If yt-dlp is missing or the download fails
+    """
+    # Take an isolated cache directory for this yt-dlp instance
+    temp_cache_dir = _cache_dirs.acquire()
+
+    try:
+        cmd = _build_ytdlp_command(
+            url, format_selector, additional_options, live_from_start, temp_cache_dir
+        )
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=temp_cache_dir,
+                limit=chunk_size,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                "yt-dlp is not installed. Install it with: pip install yt-dlp"
+            ) from None
+        if process.stdout is None or process.stderr is None:
+            raise RuntimeError("Failed to open yt-dlp output pipes")
+
+        # Drain stderr alongside stdout so a chatty yt-dlp can't stall
+        stderr_task = asyncio.create_task(_drain_stderr_async(process.stderr))
+        try:
+            while chunk := await process.stdout.read(chunk_size):
+                yield chunk
+
+            await process.wait()
+            if process.returncode != 0:
+                stderr_output = await stderr_task
+                raise RuntimeError(
+                    f"yt-dlp failed with return code {process.returncode}: {stderr_output}"
+                )
+        finally:
+            # Clean up process if still running (also when the caller stops early)
+            if process.returncode is None:
+                await _stop_process_async(process)
+            stderr_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await stderr_task
+    finally:
+        # Empty the isolated cache directory and hand it back for reuse
+        _cache_dirs.release(temp_cache_dir)
+
+
+def _copy_pipe_to_file(pipe: IO[bytes], file: IO[bytes], chunk_size: int) -> None:
+    """
+    Copy everything from a pipe into a file.
+
+    Uses splice(2) on Linux so the kernel moves pages from the pipe to the
+    file without copying them through Python; falls back to a buffered
+    copy where splice is unavailable or unsupported by the filesystem.
+    """
+    if hasattr(os, "splice"):
+        try:
+            while os.splice(pipe.fileno(), file.fileno(), _PIPE_SIZE):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            # splice advances the file offset, so the copy resumes where it stopped
+    shutil.copyfileobj(pipe, file, chunk_size)
+
+
+def stream_video_to_file(
+    url: str,
+    output_path: str | Path,
+    chunk_size: int = 1024 * 1024,
+    format_selector: str = "bestvideo+bestaudio/best",
+    additional_options: list[str] | None = None,
+    live_from_start: bool = False,
+) -> None:
+    """
+    Download a video with yt-dlp straight into a file.
+
+    Takes the same options as stream_video_chunks, but the bytes go from
+    yt-dlp's stdout to the file without passing through Python.
+
+    Args:
+        url: The video URL to download
+        output_path: File to write the video to (overwritten if it exists)
+        chunk_size: Buffer size in bytes for the fallback copy (default: 1MB)
+        format_selector: yt-dlp format selector
+        additional_options: Additional yt-dlp command-line options
+        live_from_start: For live streams, start from beginning instead of live edge
+
+    Raises:
+        RuntimeError: If yt-dlp is missing or the download fails
+    """
+    # Take an isolated cache directory for this yt-dlp instance
+    temp_cache_dir = _cache_dirs.acquire()
+
+    try:
+        cmd = _build_ytdlp_command(
+            url, format_selector, additional_options, live_from_start, temp_cache_dir
+        )
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=temp_cache_dir,
+                pipesize=_PIPE_SIZE,
+            )
+
+            if process.stdout is None:
+                raise RuntimeError("Failed to open stdout pipe")
+            if process.stderr is None:
+                raise RuntimeError("Failed to open stderr pipe")
+            stderr_tail = _StderrTail(process.stderr)
+
+            with open(output_path, "wb") as f:
+                _copy_pipe_to_file(process.stdout, f, chunk_size)
+
+            process.wait()
+            if process.returncode != 0:
+                stderr_output = stderr_tail.text()
+                raise RuntimeError(
+                    f"yt-dlp failed with return code {process.returncode}: {stderr_output}"
+                )
+
+        except FileNotFoundError:
+            raise RuntimeError(
+                "yt-dlp is not installed. Install it with: pip install yt-dlp"
+            ) from None
+        except BaseException:
+            # Clean up process if still running (also when the caller stops early)
+            if "process" in locals() and process.poll() is None:
+                _stop_process(process)
+            raise
+    finally:
+        # Empty the isolated cache directory and hand it back for reuse
+        _cache_dirs.release(temp_cache_dir)
+
+
+def _read_chunk_file(chunk_file: Path) -> bytes:
+    """
+    Read one finished chunk file and delete it; unreadable files come back empty.
+
+    Each chunk is consumed exactly once, so removing it right away frees its
+    disk space and page cache now rather than when the whole run ends, which
+    for a live stream could be hours away. The file is complete, so its size
+    is known up front and a single read() fetches it, without the extra
+    syscalls of a buffered open().read().
+    """
+    try:
+        fd = os.open(chunk_file, os.O_RDONLY)
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+    except OSError:
+        return b""
+    try:
+        os.unlink(chunk_file)
+    except OSError:
+        pass
+    return data
+
+
+def _chunk_read_executor() -> ThreadPoolExecutor:
+    """Return the process-wide chunk read pool, starting it on first use."""
+    global _chunk_read_pool
+    with _chunk_read_pool_lock:
+        if _chunk_read_pool is None:
+            _chunk_read_pool = ThreadPoolExecutor(thread_name_prefix="chunk_read")
+        return _chunk_read_pool
+
+
+def _read_chunk_files(chunk_files: list[Path]) -> Generator[bytes, None, None]:
+    """
+    Yield the contents of chunk files in order, reading a few ahead.
+
+    Reads run on the shared chunk read pool so disk I/O overlaps with the
+    consumer. At most _CHUNK_READ_WORKERS reads per stream are in flight, so a
+    slow consumer never holds more than that many chunks in memory. Empty
+    files are skipped.
+    """
+    if not chunk_files:
+        return
+
+    executor = _chunk_read_executor()
+    pending: deque[Future[bytes]] = deque()
+    try:
+        for chunk_file in chunk_files:
+            pending.append(executor.submit(_read_chunk_file, chunk_file))
+            if len(pending) < _CHUNK_READ_WORKERS:
+                continue
+            data = pending.popleft().result()
+            if data:
+                yield data
+        while pending:
+            data = pending.popleft().result()
+            if data:
+                yield data
+    finally:
+        # Drop queued reads nobody will consume if the caller stopped early
+        for future in pending:
+            future.cancel()
 
 
 def stream_and_chunk_video(
@@ -432,33 +1264,62 @@ def stream_and_chunk_video(
         )
         return
 
-    # Non-live: download to a temp file via stream_video_chunks, then segment with ffmpeg
+    # Non-live: pipe yt-dlp into the ffmpeg segmenter so chunks come out while
+    # the download is still running
     unique_id = uuid.uuid4().hex[:8]
-    temp_dir = tempfile.mkdtemp(prefix=f"video_stream_{unique_id}_")
+    temp_dir = _alloc_tmpdir(f"video_stream_{unique_id}_")
     try:
         temp_path = Path(temp_dir)
         temp_path.mkdir(parents=True, exist_ok=True)
 
+        cache_dir = temp_path / "yt-dlp-cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stream_path = temp_path / "stream"
+        stream_path.mkdir(parents=True, exist_ok=True)
+
+        ytdlp_cmd = _build_ytdlp_command(
+            url,
+            format_selector or "bestvideo+bestaudio/best",
+            [*_STREAMABLE_VOD_OPTIONS, *(additional_options or [])],
+            live_from_start=False,
+            cache_dir=str(cache_dir),
+        )
+        try:
+            yield from _segment_stream(
+                stream_path, chunk_duration, "VOD", ytdlp_cmd=ytdlp_cmd
+            )
+            return
+        except _UnstreamableSourceError as e:
+            # yt-dlp delivered the source, but not in a form ffmpeg can demux
+            # from a pipe (e.g. an MP4 with its index at the end, from a server
+            # without range requests); only a local file can be chunked. Any
+            # other failure, like a bad URL, would just fail again, so it
+            # propagates instead.
+            logger.warning(
+                f"Streaming {url} into ffmpeg failed, downloading it first: {e}"
+            )
+
+        # Fallback: download to a temp file via stream_video_to_file, then segment
         source_path = temp_path / "source.mp4"
         chunks_dir = temp_path / "chunks"
         chunks_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write streamed bytes to source file
+        # Download straight into the source file
         try:
-            with open(source_path, "wb") as f:
-                for data in stream_video_chunks(
-                    url,
-                    chunk_size=1024 * 1024,
-                    format_selector=(format_selector or "bestvideo+bestaudio/best"),
-                    additional_options=additional_options,
-                    live_from_start=False,
-                ):
-                    f.write(data)
+            stream_video_to_file(
+                url,
+                source_path,
+                chunk_size=1024 * 1024,
+                format_selector=(format_selector or "bestvideo+bestaudio/best"),
+                additional_options=additional_options,
+                live_from_start=False,
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to download video: {e}")
 
         # Segment with ffmpeg
         output_pattern = str(chunks_dir / "chunk_%05d.mp4")
+        segment_list = chunks_dir / "segments.txt"
         ffmpeg_cmd = [
             "ffmpeg",
             "-y",
@@ -476,6 +1337,8 @@ def stream_and_chunk_video(
             "mp4",
             "-reset_timestamps",
             "1",
+            "-segment_list",
+            str(segment_list),
             output_pattern,
         ]
 
@@ -495,19 +1358,11 @@ def stream_and_chunk_video(
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to chunk video with ffmpeg: {e.stderr}")
 
-        # Yield chunk files
-        for chunk_file in sorted(chunks_dir.glob("chunk_*.mp4")):
-            try:
-                with open(chunk_file, "rb") as f:
-                    data = f.read()
-                if data:
-                    yield data
-            except Exception:
-                continue
+        # Yield chunk files in the order ffmpeg listed them (no directory scan)
+        segment_names = _read_segment_list(segment_list)
+        yield from _read_chunk_files([chunks_dir / name for name in segment_names])
     finally:
         try:
-            import shutil
-
             shutil.rmtree(temp_dir)
         except Exception:
             pass
@@ -0,0 +1,72 @@
+"""
+Compare two pytest --durations reports taken on the same machine.
+
+Usage (CI runs this on the PR's base commit and head commit, back to back on
+one runner, so both reports share the same hardware):
+    uv run pytest -m "not network" --continue-on-collection-errors \
+        --durations=0 --durations-min=0.05 > durations.txt
+    uv run python tests/check_durations.py base.txt head.txt
+
+Exits non-zero if any test in both reports got more than 2x slower, counting
+anything under MIN_SECONDS as MIN_SECONDS so that jitter on fast tests is
+never reported.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+MAX_RATIO = 2.0
+# CI runners jitter by tenths of a second; a test must pass 2x this to count
+MIN_SECONDS = 0.5
+
+_LINE = re.compile(r"^(\d+(?:\.\d+)?)s\s+(setup|call|teardown)\s+(\S.*)$")
+
+
+def parse_durations(text: str) -> dict[tuple[str, str], float]:
+    """Map (phase, test id) to seconds for each line of a --durations report."""
+    durations = {}
+    for line in text.splitlines():
+        match = _LINE.match(line.strip())
+        if match:
+            seconds, phase, node_id = match.groups()
+            durations[(phase, node_id)] = float(seconds)
+    return durations
+
+
+def find_regressions(
+    base: dict[tuple[str, str], float], head: dict[tuple[str, str], float]
+) -> list[str]:
+    """Describe every test in both reports that is now more than MAX_RATIO slower."""
+    regressions = []
+    for key, before in base.items():
+        after = head.get(key)
+        if after is None:
+            continue
+        if after > max(before, MIN_SECONDS) * MAX_RATIO:
+            phase, node_id = key
+            regressions.append(f"{node_id} ({phase}): {before:.2f}s -> {after:.2f}s")
+    return regressions
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 3:
+        print(__doc__)
+        return 2
+
+    base = parse_durations(Path(argv[1]).read_text())
+    head = parse_durations(Path(argv[2]).read_text())
+    regressions = find_regressions(base, head)
+
+    if regressions:
+        print(f"Tests more than {MAX_RATIO:g}x slower than on the base commit:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"No test regressed more than {MAX_RATIO:g}x against the base commit")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
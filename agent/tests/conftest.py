@@ -2,10 +2,44 @@
 Pytest configuration for loading environment variables from .env file.
 """
 
+import hashlib
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
 from dotenv import load_dotenv
 
+from src.llm import (
+    AudioInputHook,
+    AudioOutputHook,
+    GeminiAgent,
+    ImageInputHook,
+    ImageOutputHook,
+    ModalityType,
+    TextInputHook,
+    TextOutputHook,
+    VideoInputHook,
+    VideoOutputHook,
+)
+
+# Fragmented MP4 so ffmpeg can write it to stdout
+_FFMPEG_TESTSRC_ARGS = (
+    "ffmpeg",
+    "-f",
+    "lavfi",
+    "-i",
+    "testsrc=duration=6:size=320x240:rate=1",
+    "-pix_fmt",
+    "yuv420p",
+    "-f",
+    "mp4",
+    "-movflags",
+    "frag_keyframe+empty_moov",
+    "pipe:1",
+)
+
 
 def pytest_configure(config):
     """
@@ -23,3 +57,135 @@ def pytest_configure(config):
         print(f"\n✓ Loaded environment variables from {env_file}")
     else:
         print(f"\n⚠ Warning: .env file not found at {env_file}")
+
+
+@pytest.fixture(scope="session")
+def shared_agent():
+    """
+    GeminiAgent shared across the whole session.
+
+    Only use this for read-only tests; tests that clear or register hooks
+    must use `fresh_agent` instead. One input is dispatched up front so the
+    Gemini SDK import and hook setup are paid in fixture setup, and
+    `--durations` doesn't charge them to whichever test uses it first.
+    """
+    agent = GeminiAgent()
+    agent.process_input("x", ModalityType.TEXT)
+    return agent
+
+
+@pytest.fixture(scope="session")
+def sample_inputs(shared_agent):
+    """Processed inputs reused by tests that only need a representative input."""
+    return {
+        "text": shared_agent.process_input("Test", ModalityType.TEXT),
+        "video": shared_agent.process_input(b"video data", ModalityType.VIDEO),
+        "image": shared_agent.process_input(b"image data", ModalityType.IMAGE),
+        "audio": shared_agent.process_input(b"audio data", ModalityType.AUDIO),
+    }
+
+
+@pytest.fixture
+def fresh_agent():
+    """Create a new GeminiAgent for tests that mutate its hooks."""
+    return GeminiAgent()
+
+
+@pytest.fixture(scope="session")
+def hooks():
+    """Instantiate each default hook once; they are stateless and safe to share."""
+    return {
+        "text_in": TextInputHook(),
+        "video_in": VideoInputHook(),
+        "audio_in": AudioInputHook(),
+        "image_in": ImageInputHook(),
+        "text_out": TextOutputHook(),
+        "video_out": VideoOutputHook(),
+        "audio_out": AudioOutputHook(),
+        "image_out": ImageOutputHook(),
+    }
+
+
+@pytest.fixture
+def hookless_agent():
+    """GeminiAgent with no hooks, built without running __init__ or registration."""
+    agent = GeminiAgent.__new__(GeminiAgent)
+    agent.input_hooks = {}
+    agent.output_hooks = {}
+    return agent
+
+
+@pytest.fixture(scope="session")
+def test_mp4_bytes(pytestconfig):
+    """
+    Render a 6-second testsrc clip as fragmented MP4, cached across sessions.
+
+    Fragmented MP4 can be streamed to a pipe, so the bytes come straight from
+    ffmpeg's stdout without a temp file. The result is stored in the pytest
+    cache under a hash of the ffmpeg arguments, so later runs skip ffmpeg.
+    """
+    # The cache plugin is absent under `-p no:cacheprovider`
+    cache = getattr(pytestconfig, "cache", None)
+    cached_path = None
+    if cache is not None:
+        key = hashlib.sha1("|".join(_FFMPEG_TESTSRC_ARGS).encode()).hexdigest()
+        cached_path = Path(cache.mkdir("mp4")) / f"{key}.mp4"
+        if cached_path.exists():
+            return cached_path.read_bytes()
+
+    try:
+        data = subprocess.run(
+            _FFMPEG_TESTSRC_ARGS, capture_output=True, check=True
+        ).stdout
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        pytest.skip(f"ffmpeg unavailable: {e}")
+
+    if cached_path is not None:
+        cached_path.write_bytes(data)
+    return data
+
+
+@pytest.fixture(scope="session")
+def local_video_url(test_mp4_bytes):
+    """
+    Serve the session test MP4 from a local HTTP server.
+
+    E2E tests download from here instead of a public host, so they need no
+    network access and don't pay WAN latency.
+    """
+
+    class _MP4Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "video/mp4")
+            self.send_header("Content-Length", str(len(test_mp4_bytes)))
+            self.end_headers()
+            self.wfile.write(test_mp4_bytes)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MP4Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/test.mp4"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _null_stream(request, monkeypatch):
+    """
+    Replace the pipeline's video download with an empty stream.
+
+    Tests that need data stub in their own chunks on top of this, so no
+    unit test can reach yt-dlp or the network by accident. Tests marked
+    `real_stream` or `network` exercise the real downloader and are left alone.
+    """
+    if any(request.node.get_closest_marker(m) for m in ("real_stream", "network")):
+        return
+    monkeypatch.setattr(
+        "src.pipeline.stream_and_chunk_video", lambda *_a, **_kw: iter(())
+    )
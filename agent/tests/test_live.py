@@ -410,7 +410,6 @@ class TestConcatenateChunks:
 class TestProcessChunksWithLiveApi:
     """Tests for process_chunks_with_live_api function."""
 
-    @pytest.mark.asyncio
     async def test_process_chunks_basic(self):
         """Test basic processing of chunks with Live API."""
         chunks = [b"chunk1", b"chunk2"]
@@ -473,7 +472,6 @@ class TestProcessChunksWithLiveApi:
             )
             assert msg["data"]["metadata"]["format"] == "fragmented_mp4"
 
-    @pytest.mark.asyncio
     async def test_process_chunks_with_custom_parameters(self):
         """Test processing with custom parameters."""
         chunks = [b"chunk1"]
@@ -522,7 +520,6 @@ class TestProcessChunksWithLiveApi:
             # Verify custom prompt was sent
             mock_client.send_text.assert_called_with(custom_prompt)
 
-    @pytest.mark.asyncio
     async def test_process_chunks_connection_error(self):
         """Test handling of connection errors."""
         chunks = [b"chunk1"]
@@ -542,7 +539,6 @@ class TestProcessChunksWithLiveApi:
                     video_url="https://example.com/video.mp4",
                 )
 
-    @pytest.mark.asyncio
     async def test_process_chunks_cleanup_on_error(self):
         """Test that client is disconnected even on error."""
         chunks = [b"chunk1"]
@@ -584,7 +580,6 @@ class TestProcessChunksWithLiveApi:
 class TestLiveApiIntegration:
     """Integration tests with real Gemini Live API."""
 
-    @pytest.mark.asyncio
     async def test_real_gemini_live_api_with_short_clip(self):
         """
         Real integration test using actual Gemini Live API.
@@ -797,7 +792,6 @@ class TestTempFileCleanup:
 class TestFullWebSocketIntegration:
     """Full end-to-end integration tests with real WebSocket connections."""
 
-    @pytest.mark.asyncio
     async def test_websocket_integration_with_mocked_live_api(self):
         """
         Full integration test with real WebSocket server and client.
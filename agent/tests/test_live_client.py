@@ -5,7 +5,10 @@ These tests verify the live streaming functionality, including
 video input and audio output streaming via WebSocket.
 """
 
+import hashlib
+import io
 import os
+import wave
 from pathlib import Path
 from typing import AsyncIterator
 
@@ -15,6 +18,48 @@ from PIL import Image
 from src.llm import GeminiLiveClient
 
 
+def _encode_once() -> bytes:
+    """Encode a 100x100 red square as JPEG bytes."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (100, 100), color="red").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+# Test frames are built once at import instead of per test invocation
+_RED_100_JPEG: bytes = _encode_once()
+_MOCK_FRAMES = [Image.new("RGB", (100, 100), color=c) for c in ("red", "green", "blue")]
+
+
+async def _write_wav(path: Path, chunks: AsyncIterator[bytes]) -> tuple[int, str]:
+    """
+    Stream Live API audio (24kHz mono 16-bit PCM) into a WAV file as it arrives.
+
+    Returns the number of PCM bytes written and their SHA-256, so the caller
+    can check the file without holding the whole payload in memory.
+    """
+    digest = hashlib.sha256()
+    total = 0
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)  # 16-bit
+        wf.setframerate(24000)
+        async for chunk in chunks:
+            wf.writeframes(chunk)
+            digest.update(chunk)
+            total += len(chunk)
+    return total, digest.hexdigest()
+
+
+def _assert_wav_matches(path: Path, total: int, sha256: str) -> None:
+    """Check that a WAV file written by _write_wav holds exactly the streamed audio."""
+    with wave.open(str(path), "rb") as wf:
+        params = (wf.getnchannels(), wf.getsampwidth(), wf.getframerate())
+        frames = wf.readframes(wf.getnframes())
+    assert params == (1, 2, 24000)
+    assert len(frames) == total
+    assert hashlib.sha256(frames).hexdigest() == sha256
+
+
 class TestGeminiLiveClientInitialization:
     """Test GeminiLiveClient initialization."""
 
@@ -60,7 +105,6 @@ class TestGeminiLiveClientConnection:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiLiveClient(api_key=api_key)
 
-    @pytest.mark.asyncio
     async def test_connect_and_disconnect(self, client_with_api):
         """Test establishing and closing WebSocket connection."""
         await client_with_api.connect()
@@ -69,7 +113,6 @@ class TestGeminiLiveClientConnection:
         await client_with_api.disconnect()
         assert client_with_api._session is None
 
-    @pytest.mark.asyncio
     async def test_context_manager(self, client_with_api):
         """Test using client as async context manager."""
         async with client_with_api as client:
@@ -78,7 +121,6 @@ class TestGeminiLiveClientConnection:
         # After exiting context, session should be closed
         assert client_with_api._session is None
 
-    @pytest.mark.asyncio
     async def test_connect_with_custom_config(self, client_with_api):
         """Test connecting with custom configuration."""
         await client_with_api.connect(
@@ -88,7 +130,6 @@ class TestGeminiLiveClientConnection:
         assert client_with_api._session is not None
         await client_with_api.disconnect()
 
-    @pytest.mark.asyncio
     async def test_connect_without_api_key_raises_error(self):
         """Test that connecting without API key raises error."""
         client = GeminiLiveClient(api_key=None)
@@ -109,25 +150,21 @@ class TestGeminiLiveClientSending:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiLiveClient(api_key=api_key)
 
-    @pytest.mark.asyncio
     async def test_send_text_without_session_raises_error(self, client_with_api):
         """Test that sending text without session raises error."""
         with pytest.raises(ValueError, match="Session not connected"):
             await client_with_api.send_text("Test")
 
-    @pytest.mark.asyncio
     async def test_send_video_without_session_raises_error(self, client_with_api):
         """Test that sending video without session raises error."""
         with pytest.raises(ValueError, match="Session not connected"):
-            await client_with_api.send_video_frame(b"video data")
+            await client_with_api.send_frame(b"video data")
 
-    @pytest.mark.asyncio
     async def test_send_audio_without_session_raises_error(self, client_with_api):
         """Test that sending audio without session raises error."""
         with pytest.raises(ValueError, match="Session not connected"):
             await client_with_api.send_audio_chunk(b"audio data")
 
-    @pytest.mark.asyncio
     async def test_send_text_with_session(self, client_with_api):
         """Test sending text input after connecting."""
         async with client_with_api:
@@ -136,25 +173,11 @@ class TestGeminiLiveClientSending:
                 "Please provide commentary on the following video."
             )
 
-    @pytest.mark.asyncio
     async def test_send_video_frame(self, client_with_api):
         """Test sending video frame data."""
-        import io
-
-        from PIL import Image
-
-        # Create a simple test image (100x100 red square)
-        test_image = Image.new("RGB", (100, 100), color="red")
-
-        # Convert to bytes
-        img_bytes = io.BytesIO()
-        test_image.save(img_bytes, format="JPEG")
-        img_bytes.seek(0)
-        frame_data = img_bytes.read()
-
         async with client_with_api:
             # Should not raise an error
-            await client_with_api.send_video_frame(frame_data)
+            await client_with_api.send_frame(_RED_100_JPEG)
 
 
 class TestGeminiLiveClientReceiving:
@@ -168,7 +191,6 @@ class TestGeminiLiveClientReceiving:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiLiveClient(api_key=api_key)
 
-    @pytest.mark.asyncio
     async def test_receive_without_session_raises_error(self, client_with_api):
         """Test that receiving without session raises error."""
         with pytest.raises(ValueError, match="Session not connected"):
@@ -187,7 +209,6 @@ class TestGeminiLiveClientE2E:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiLiveClient(api_key=api_key)
 
-    @pytest.mark.asyncio
     async def test_e2e_video_to_audio_generation(self, client_with_api):
         """Test generating audio commentary from a video file."""
         test_dir = Path(__file__).parent / "assets"
@@ -196,25 +217,25 @@ class TestGeminiLiveClientE2E:
         if not video_path.exists():
             pytest.skip("Test video not available in assets folder")
 
+        # Stream audio straight to disk for manual verification
+        output_path = test_dir / "test_live_output_audio.wav"
+
         async with client_with_api:
-            audio_output = await client_with_api.generate_audio_from_video(
-                video_path=video_path,
-                prompt="Provide a brief sports commentary for this video clip.",
+            total, sha256 = await _write_wav(
+                output_path,
+                client_with_api.stream_audio_from_video(
+                    video_path,
+                    prompt="Provide a brief sports commentary for this video clip.",
+                ),
             )
 
-        # Verify we got audio data back
-        assert isinstance(audio_output, bytes)
-        assert len(audio_output) > 0
-
-        # Save output for manual verification
-        output_path = test_dir / "test_live_output_audio.wav"
-        with open(output_path, "wb") as f:
-            f.write(audio_output)
+        # Verify we got audio data back, and that the file holds all of it
+        assert total > 0
+        _assert_wav_matches(output_path, total, sha256)
 
-        print(f"\n✅ E2E Live Test - Generated {len(audio_output)} bytes of audio")
+        print(f"\n✅ E2E Live Test - Generated {total} bytes of audio")
         print(f"   Audio saved to: {output_path}")
 
-    @pytest.mark.asyncio
     async def test_e2e_stream_video_with_audio_callback(self, client_with_api):
         """Test streaming video with callback for each audio chunk."""
         test_dir = Path(__file__).parent / "assets"
@@ -248,7 +269,6 @@ class TestGeminiLiveClientE2E:
         )
         print(f"   Total audio size: {len(audio_output)} bytes")
 
-    @pytest.mark.asyncio
     async def test_e2e_multiple_videos_sequential(self, client_with_api):
         """Test processing multiple videos sequentially."""
         test_dir = Path(__file__).parent / "assets"
@@ -278,7 +298,6 @@ class TestGeminiLiveClientE2E:
         print(f"   Video 1 audio: {len(audio1)} bytes")
         print(f"   Video 2 audio: {len(audio2)} bytes")
 
-    @pytest.mark.asyncio
     async def test_e2e_custom_system_instruction(self, client_with_api):
         """Test with custom system instruction."""
         test_dir = Path(__file__).parent / "assets"
@@ -295,23 +314,21 @@ class TestGeminiLiveClientE2E:
             "Use exciting language and sound effects.",
         )
 
+        # Save with different name, streaming chunks to disk as they arrive
+        output_path = test_dir / "test_live_custom_instruction_audio.wav"
+
         async with custom_client:
-            audio_output = await custom_client.generate_audio_from_video(
-                video_path=video_path,
-                prompt="Introduce this exciting moment!",
+            total, sha256 = await _write_wav(
+                output_path,
+                custom_client.stream_audio_from_video(
+                    video_path, prompt="Introduce this exciting moment!"
+                ),
             )
 
-        assert isinstance(audio_output, bytes)
-        assert len(audio_output) > 0
-
-        # Save with different name
-        output_path = test_dir / "test_live_custom_instruction_audio.wav"
-        with open(output_path, "wb") as f:
-            f.write(audio_output)
+        assert total > 0
+        _assert_wav_matches(output_path, total, sha256)
 
-        print(
-            f"\n✅ E2E Live Test - Custom instruction generated {len(audio_output)} bytes"
-        )
+        print(f"\n✅ E2E Live Test - Custom instruction generated {total} bytes")
         print(f"   Audio saved to: {output_path}")
 
 
@@ -362,15 +379,9 @@ class TestGeminiLiveClientAsyncIterator:
 
     async def mock_video_stream(self) -> AsyncIterator[Image.Image]:
         """Mock async iterator that yields image frames."""
-        from PIL import Image
-
-        # Generate a few test frames (colored squares)
-        colors = ["red", "green", "blue"]
-        for color in colors:
-            frame = Image.new("RGB", (100, 100), color=color)
+        for frame in _MOCK_FRAMES:
             yield frame
 
-    @pytest.mark.asyncio
     async def test_stream_video_chunks(self, client_with_api):
         """Test streaming video frames via async iterator."""
         async with client_with_api:
@@ -395,7 +406,6 @@ class TestGeminiLiveClientErrorHandling:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiLiveClient(api_key=api_key)
 
-    @pytest.mark.asyncio
     async def test_generate_audio_without_connection_raises_error(
         self, client_with_api
     ):
@@ -413,7 +423,6 @@ class TestGeminiLiveClientErrorHandling:
                 prompt="Test",
             )
 
-    @pytest.mark.asyncio
     async def test_invalid_video_path_handling(self, client_with_api):
         """Test handling of invalid video path."""
         async with client_with_api:
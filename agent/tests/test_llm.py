@@ -6,26 +6,96 @@ actual end-to-end Gemini API calls.
 """
 
 import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, get_type_hints
 
 import pytest
 
 from src.llm import (
     AgentInput,
     AgentOutput,
-    AudioInputHook,
-    AudioOutputHook,
     GeminiAgent,
-    ImageInputHook,
-    ImageOutputHook,
     InputHook,
     ModalityType,
     OutputHook,
-    TextInputHook,
-    TextOutputHook,
-    VideoInputHook,
-    VideoOutputHook,
 )
 
+FAKE_VIDEO = b"fake video data"
+FAKE_AUDIO = b"fake audio data"
+FAKE_IMAGE = b"fake image data"
+
+
+@lru_cache(maxsize=8)
+def _long(ch: str, n: int) -> str:
+    """Build (once) a string long enough to trigger repr truncation."""
+    return ch * n
+
+
+class CustomTextHook(InputHook):
+    """Hook that uppercases text input and tags it as custom."""
+
+    def process(self, raw_input):
+        return AgentInput(
+            modality=ModalityType.TEXT,
+            data=raw_input.upper(),  # Custom processing
+            metadata={"custom": True},
+        )
+
+    def supports_modality(self):
+        return ModalityType.TEXT
+
+
+class CustomTextOutputHook(OutputHook):
+    """Hook that prefixes text output."""
+
+    def process(self, agent_output):
+        return f"CUSTOM: {agent_output.data}"
+
+    def supports_modality(self):
+        return ModalityType.TEXT
+
+
+class UppercaseTextHook(InputHook):
+    """Hook that uppercases text input."""
+
+    def process(self, raw_input):
+        return AgentInput(
+            modality=ModalityType.TEXT,
+            data=raw_input.upper(),
+            metadata={"preprocessed": "uppercase"},
+        )
+
+    def supports_modality(self):
+        return ModalityType.TEXT
+
+
+class MarkdownOutputHook(OutputHook):
+    """Hook that formats output as markdown."""
+
+    def process(self, agent_output):
+        return f"# Response\n\n{agent_output.data}"
+
+    def supports_modality(self):
+        return ModalityType.TEXT
+
+
+def _check_input(result, modality, data, has_source=False):
+    """Assert that result is an AgentInput wrapping data for the given modality."""
+    # AgentInput has no subclasses here, so an exact type check is sufficient
+    assert type(result) is AgentInput
+    assert result.modality is modality
+    assert result.data == data
+    if has_source:
+        assert result.metadata is not None
+        assert result.metadata["source"] == str(data)
+
+
+def _check_output(result, expected):
+    """Assert that a processed output has exactly the expected type and value."""
+    assert type(result) is type(expected)
+    assert result == expected
+
 
 class TestModalityType:
     """Test ModalityType enum."""
@@ -79,104 +149,60 @@ class TestAgentOutput:
 class TestInputHooks:
     """Test input hook implementations."""
 
-    def test_text_input_hook(self):
-        """Test TextInputHook processing."""
-        hook = TextInputHook()
-        assert hook.supports_modality() == ModalityType.TEXT
-
-        result = hook.process("Test text")
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.TEXT
-        assert result.data == "Test text"
-
-    def test_video_input_hook_with_path(self):
-        """Test VideoInputHook with file path."""
-        hook = VideoInputHook()
-        assert hook.supports_modality() == ModalityType.VIDEO
-
-        result = hook.process("/path/to/video.mp4")
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.VIDEO
-        assert result.data == "/path/to/video.mp4"
-        assert result.metadata is not None
-        assert "source" in result.metadata
-
-    def test_video_input_hook_with_bytes(self):
-        """Test VideoInputHook with bytes."""
-        hook = VideoInputHook()
-        video_bytes = b"fake video data"
-
-        result = hook.process(video_bytes)
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.VIDEO
-        assert result.data == video_bytes
-
-    def test_audio_input_hook(self):
-        """Test AudioInputHook processing."""
-        hook = AudioInputHook()
-        assert hook.supports_modality() == ModalityType.AUDIO
-
-        result = hook.process("/path/to/audio.mp3")
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.AUDIO
-        assert result.data == "/path/to/audio.mp3"
-
-    def test_image_input_hook(self):
-        """Test ImageInputHook processing."""
-        hook = ImageInputHook()
-        assert hook.supports_modality() == ModalityType.IMAGE
-
-        result = hook.process("/path/to/image.jpg")
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.IMAGE
-        assert result.data == "/path/to/image.jpg"
+    @pytest.mark.parametrize(
+        "hook_name,modality,sample",
+        [
+            ("text_in", ModalityType.TEXT, "Test text"),
+            ("video_in", ModalityType.VIDEO, "/path/to/video.mp4"),
+            ("audio_in", ModalityType.AUDIO, "/path/to/audio.mp3"),
+            ("image_in", ModalityType.IMAGE, "/path/to/image.jpg"),
+        ],
+    )
+    def test_input_hook(self, hooks, hook_name, modality, sample):
+        """Test each input hook reports its modality and wraps the raw input."""
+        hook = hooks[hook_name]
+        assert hook.supports_modality() == modality
+
+        _check_input(hook.process(sample), modality, sample)
+
+
+OUTPUT_HOOK_NAMES = {
+    ModalityType.TEXT: "text_out",
+    ModalityType.VIDEO: "video_out",
+    ModalityType.AUDIO: "audio_out",
+    ModalityType.IMAGE: "image_out",
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        (ModalityType.TEXT, "Response text", "Response text"),
+        (ModalityType.VIDEO, FAKE_VIDEO, FAKE_VIDEO),
+        (ModalityType.AUDIO, FAKE_AUDIO, FAKE_AUDIO),
+        (ModalityType.IMAGE, FAKE_IMAGE, FAKE_IMAGE),
+        # Media hooks return empty bytes for non-bytes data
+        (ModalityType.VIDEO, "not bytes", b""),
+        (ModalityType.AUDIO, "not bytes", b""),
+        (ModalityType.IMAGE, "not bytes", b""),
+    ],
+)
+def output_case(request):
+    """AgentOutput and the payload its hook is expected to return."""
+    modality, data, expected = request.param
+    return AgentOutput(modality=modality, data=data), expected
 
 
 class TestOutputHooks:
     """Test output hook implementations."""
 
-    def test_text_output_hook(self):
-        """Test TextOutputHook processing."""
-        hook = TextOutputHook()
-        assert hook.supports_modality() == ModalityType.TEXT
+    def test_output_hook(self, hooks, output_case):
+        """Test each output hook reports its modality and returns the payload."""
+        output, expected = output_case
+        hook = hooks[OUTPUT_HOOK_NAMES[output.modality]]
+        assert hook.supports_modality() == output.modality
 
-        output = AgentOutput(modality=ModalityType.TEXT, data="Response text")
-        result = hook.process(output)
-        assert isinstance(result, str)
-        assert result == "Response text"
-
-    def test_video_output_hook(self):
-        """Test VideoOutputHook processing."""
-        hook = VideoOutputHook()
-        assert hook.supports_modality() == ModalityType.VIDEO
-
-        video_bytes = b"video output data"
-        output = AgentOutput(modality=ModalityType.VIDEO, data=video_bytes)
-        result = hook.process(output)
-        assert isinstance(result, bytes)
-        assert result == video_bytes
-
-    def test_audio_output_hook(self):
-        """Test AudioOutputHook processing."""
-        hook = AudioOutputHook()
-        assert hook.supports_modality() == ModalityType.AUDIO
-
-        audio_bytes = b"audio output data"
-        output = AgentOutput(modality=ModalityType.AUDIO, data=audio_bytes)
-        result = hook.process(output)
-        assert isinstance(result, bytes)
-        assert result == audio_bytes
-
-    def test_image_output_hook(self):
-        """Test ImageOutputHook processing."""
-        hook = ImageOutputHook()
-        assert hook.supports_modality() == ModalityType.IMAGE
-
-        image_bytes = b"image output data"
-        output = AgentOutput(modality=ModalityType.IMAGE, data=image_bytes)
-        result = hook.process(output)
-        assert isinstance(result, bytes)
-        assert result == image_bytes
+        _check_output(hook.process(output), expected)
 
 
 class TestGeminiAgent:
@@ -191,105 +217,63 @@ class TestGeminiAgent:
         assert len(agent.input_hooks) == 4  # text, video, audio, image
         assert len(agent.output_hooks) == 4  # text, video, audio, image
 
-    def test_agent_default_hooks_registered(self):
+    def test_agent_default_hooks_registered(self, shared_agent):
         """Test that default hooks are registered."""
-        agent = GeminiAgent()
-
-        assert ModalityType.TEXT in agent.input_hooks
-        assert ModalityType.VIDEO in agent.input_hooks
-        assert ModalityType.AUDIO in agent.input_hooks
-        assert ModalityType.IMAGE in agent.input_hooks
+        assert ModalityType.TEXT in shared_agent.input_hooks
+        assert ModalityType.VIDEO in shared_agent.input_hooks
+        assert ModalityType.AUDIO in shared_agent.input_hooks
+        assert ModalityType.IMAGE in shared_agent.input_hooks
 
-        assert ModalityType.TEXT in agent.output_hooks
-        assert ModalityType.VIDEO in agent.output_hooks
-        assert ModalityType.AUDIO in agent.output_hooks
-        assert ModalityType.IMAGE in agent.output_hooks
+        assert ModalityType.TEXT in shared_agent.output_hooks
+        assert ModalityType.VIDEO in shared_agent.output_hooks
+        assert ModalityType.AUDIO in shared_agent.output_hooks
+        assert ModalityType.IMAGE in shared_agent.output_hooks
 
-    def test_register_custom_input_hook(self):
+    def test_register_custom_input_hook(self, fresh_agent):
         """Test registering a custom input hook."""
-        agent = GeminiAgent()
-
-        class CustomTextHook(InputHook):
-            def process(self, raw_input):
-                return AgentInput(
-                    modality=ModalityType.TEXT,
-                    data=raw_input.upper(),  # Custom processing
-                    metadata={"custom": True},
-                )
-
-            def supports_modality(self):
-                return ModalityType.TEXT
-
         custom_hook = CustomTextHook()
-        agent.register_input_hook(custom_hook)
+        fresh_agent.register_input_hook(custom_hook)
 
         # Verify the custom hook is registered
-        assert agent.input_hooks[ModalityType.TEXT] is custom_hook
+        assert fresh_agent.input_hooks[ModalityType.TEXT] is custom_hook
 
-    def test_register_custom_output_hook(self):
+    def test_register_custom_output_hook(self, fresh_agent):
         """Test registering a custom output hook."""
-        agent = GeminiAgent()
-
-        class CustomTextOutputHook(OutputHook):
-            def process(self, agent_output):
-                return f"CUSTOM: {agent_output.data}"
-
-            def supports_modality(self):
-                return ModalityType.TEXT
-
         custom_hook = CustomTextOutputHook()
-        agent.register_output_hook(custom_hook)
+        fresh_agent.register_output_hook(custom_hook)
 
         # Verify the custom hook is registered
-        assert agent.output_hooks[ModalityType.TEXT] is custom_hook
+        assert fresh_agent.output_hooks[ModalityType.TEXT] is custom_hook
 
-    def test_process_input_text(self):
+    def test_process_input_text(self, shared_agent):
         """Test processing text input."""
-        agent = GeminiAgent()
-
-        result = agent.process_input("Hello, AI!", ModalityType.TEXT)
+        result = shared_agent.process_input("Hello, AI!", ModalityType.TEXT)
+        _check_input(result, ModalityType.TEXT, "Hello, AI!")
 
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.TEXT
-        assert result.data == "Hello, AI!"
-
-    def test_process_input_video(self):
+    def test_process_input_video(self, shared_agent):
         """Test processing video input."""
-        agent = GeminiAgent()
+        result = shared_agent.process_input("/path/to/video.mp4", ModalityType.VIDEO)
+        _check_input(result, ModalityType.VIDEO, "/path/to/video.mp4", has_source=True)
 
-        result = agent.process_input("/path/to/video.mp4", ModalityType.VIDEO)
-
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.VIDEO
-        assert result.data == "/path/to/video.mp4"
-
-    def test_process_input_unsupported_modality(self):
+    def test_process_input_unsupported_modality(self, hookless_agent):
         """Test processing input with unregistered modality."""
-        agent = GeminiAgent()
-        agent.input_hooks.clear()  # Remove all hooks
-
         with pytest.raises(ValueError, match="No input hook registered"):
-            agent.process_input("data", ModalityType.TEXT)
+            hookless_agent.process_input("data", ModalityType.TEXT)
 
-    def test_process_output_text(self):
+    def test_process_output_text(self, shared_agent):
         """Test processing text output."""
-        agent = GeminiAgent()
-
         output = AgentOutput(modality=ModalityType.TEXT, data="Generated text")
-        result = agent.process_output(output)
+        result = shared_agent.process_output(output)
 
         assert isinstance(result, str)
         assert result == "Generated text"
 
-    def test_process_output_unsupported_modality(self):
+    def test_process_output_unsupported_modality(self, hookless_agent):
         """Test processing output with unregistered modality."""
-        agent = GeminiAgent()
-        agent.output_hooks.clear()  # Remove all hooks
-
         output = AgentOutput(modality=ModalityType.TEXT, data="test")
 
         with pytest.raises(ValueError, match="No output hook registered"):
-            agent.process_output(output)
+            hookless_agent.process_output(output)
 
     @pytest.fixture
     def agent_with_api(self):
@@ -299,7 +283,6 @@ class TestGeminiAgent:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiAgent(api_key=api_key, model_name="gemini-2.5-flash")
 
-    @pytest.mark.asyncio
     async def test_generate_placeholder(self, agent_with_api):
         """Test generate method (placeholder implementation)."""
         text_input = agent_with_api.process_input("Test prompt", ModalityType.TEXT)
@@ -308,88 +291,25 @@ class TestGeminiAgent:
         assert isinstance(result, AgentOutput)
         assert result.modality == ModalityType.TEXT
 
-    @pytest.mark.asyncio
-    async def test_generate_text_convenience(self, agent_with_api):
-        """Test generate_text convenience method."""
-        result = await agent_with_api.generate_text("What is AI?")
-
-        assert isinstance(result, str)
-
-    @pytest.mark.asyncio
-    async def test_generate_from_video_convenience(self, agent_with_api):
-        """Test generate_from_video convenience method."""
-        result = await agent_with_api.generate_from_video(
-            "/path/to/video.mp4", "Describe this video"
-        )
-
-        assert isinstance(result, str)
-
-    @pytest.mark.asyncio
-    async def test_generate_from_audio_convenience(self, agent_with_api):
-        """Test generate_from_audio convenience method."""
-        result = await agent_with_api.generate_from_audio(
-            "/path/to/audio.mp3", "Transcribe this"
-        )
-
-        assert isinstance(result, str)
-
-    @pytest.mark.asyncio
-    async def test_generate_multimodal(self, agent_with_api):
-        """Test generate_multimodal convenience method."""
-        result = await agent_with_api.generate_multimodal(
-            text_prompts=["Analyze these"],
-            images=["/path/to/img1.jpg", "/path/to/img2.jpg"],
-            videos=["/path/to/video.mp4"],
-            audios=["/path/to/audio.mp3"],
-        )
-
-        assert isinstance(result, str)
-
 
 class TestCustomHooks:
     """Test custom hook implementations."""
 
-    def test_custom_preprocessing_hook(self):
+    def test_custom_preprocessing_hook(self, fresh_agent):
         """Test custom input hook with preprocessing."""
+        fresh_agent.register_input_hook(UppercaseTextHook())
 
-        class UppercaseTextHook(InputHook):
-            """Hook that uppercases text input."""
-
-            def process(self, raw_input):
-                return AgentInput(
-                    modality=ModalityType.TEXT,
-                    data=raw_input.upper(),
-                    metadata={"preprocessed": "uppercase"},
-                )
-
-            def supports_modality(self):
-                return ModalityType.TEXT
-
-        agent = GeminiAgent()
-        agent.register_input_hook(UppercaseTextHook())
-
-        result = agent.process_input("hello world", ModalityType.TEXT)
+        result = fresh_agent.process_input("hello world", ModalityType.TEXT)
 
         assert result.data == "HELLO WORLD"
         assert result.metadata["preprocessed"] == "uppercase"
 
-    def test_custom_postprocessing_hook(self):
+    def test_custom_postprocessing_hook(self, fresh_agent):
         """Test custom output hook with postprocessing."""
-
-        class MarkdownOutputHook(OutputHook):
-            """Hook that formats output as markdown."""
-
-            def process(self, agent_output):
-                return f"# Response\n\n{agent_output.data}"
-
-            def supports_modality(self):
-                return ModalityType.TEXT
-
-        agent = GeminiAgent()
-        agent.register_output_hook(MarkdownOutputHook())
+        fresh_agent.register_output_hook(MarkdownOutputHook())
 
         output = AgentOutput(modality=ModalityType.TEXT, data="Simple text")
-        result = agent.process_output(output)
+        result = fresh_agent.process_output(output)
 
         assert result.startswith("# Response")
         assert "Simple text" in result
@@ -398,132 +318,57 @@ class TestCustomHooks:
 class TestAgentInputOutputRepr:
     """Test __repr__ methods for AgentInput and AgentOutput."""
 
-    def test_agent_input_repr_short_text(self):
-        """Test AgentInput repr with short text."""
-        input_data = AgentInput(modality=ModalityType.TEXT, data="Short text")
-        repr_str = repr(input_data)
-        assert "AgentInput" in repr_str
-        assert "Short text" in repr_str
-        assert "TEXT" in repr_str
-
-    def test_agent_input_repr_long_text(self):
-        """Test AgentInput repr truncates long text."""
-        long_text = "x" * 100
-        input_data = AgentInput(modality=ModalityType.TEXT, data=long_text)
-        repr_str = repr(input_data)
-        assert "..." in repr_str
-        # Should not contain the full text
-        assert long_text not in repr_str
-
-    def test_agent_output_repr_short_text(self):
-        """Test AgentOutput repr with short text."""
-        output_data = AgentOutput(modality=ModalityType.TEXT, data="Short output")
-        repr_str = repr(output_data)
-        assert "AgentOutput" in repr_str
-        assert "Short output" in repr_str
-
-    def test_agent_output_repr_long_text(self):
-        """Test AgentOutput repr truncates long text."""
-        long_text = "y" * 100
-        output_data = AgentOutput(modality=ModalityType.TEXT, data=long_text)
-        repr_str = repr(output_data)
-        assert "..." in repr_str
+    @pytest.mark.parametrize(
+        "cls,data,must_contain,must_not_contain",
+        [
+            (AgentInput, "Short text", ["AgentInput", "Short text", "TEXT"], None),
+            # Long text is truncated and should not contain the full text
+            (AgentInput, _long("x", 100), ["..."], _long("x", 100)),
+            (AgentOutput, "Short output", ["AgentOutput", "Short output"], None),
+            (AgentOutput, _long("y", 100), ["..."], _long("y", 100)),
+        ],
+    )
+    def test_repr(self, cls, data, must_contain, must_not_contain):
+        """Test repr previews short text and truncates long text."""
+        repr_str = repr(cls(modality=ModalityType.TEXT, data=data))
+        for expected in must_contain:
+            assert expected in repr_str
+        if must_not_contain:
+            assert must_not_contain not in repr_str
 
 
 class TestInputHookEdgeCases:
     """Test edge cases for input hooks."""
 
-    def test_audio_input_hook_with_bytes(self):
-        """Test AudioInputHook with raw bytes."""
-        hook = AudioInputHook()
-        audio_bytes = b"fake audio data"
-
-        result = hook.process(audio_bytes)
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.AUDIO
-        assert result.data == audio_bytes
+    @pytest.mark.parametrize(
+        "hook_name,modality,sample",
+        [
+            ("video_in", ModalityType.VIDEO, FAKE_VIDEO),
+            ("audio_in", ModalityType.AUDIO, FAKE_AUDIO),
+            ("image_in", ModalityType.IMAGE, FAKE_IMAGE),
+        ],
+    )
+    def test_media_input_hook_with_bytes(self, hooks, hook_name, modality, sample):
+        """Test media input hooks with raw bytes."""
+        result = hooks[hook_name].process(sample)
+        _check_input(result, modality, sample)
         # Should not have metadata for bytes
         assert result.metadata == {}
 
-    def test_image_input_hook_with_bytes(self):
-        """Test ImageInputHook with raw bytes."""
-        hook = ImageInputHook()
-        image_bytes = b"fake image data"
-
-        result = hook.process(image_bytes)
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.IMAGE
-        assert result.data == image_bytes
-        assert result.metadata == {}
-
-    def test_video_input_hook_with_path_object(self):
-        """Test VideoInputHook with Path object."""
-        from pathlib import Path
-
-        hook = VideoInputHook()
-        video_path = Path("/path/to/video.mp4")
-
-        result = hook.process(video_path)
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.VIDEO
-        assert result.data == video_path
-        assert "source" in result.metadata
-        assert result.metadata["source"] == str(video_path)
-
-    def test_audio_input_hook_with_path_object(self):
-        """Test AudioInputHook with Path object."""
-        from pathlib import Path
-
-        hook = AudioInputHook()
-        audio_path = Path("/path/to/audio.mp3")
-
-        result = hook.process(audio_path)
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.AUDIO
-        assert "source" in result.metadata
-
-    def test_image_input_hook_with_path_object(self):
-        """Test ImageInputHook with Path object."""
-        from pathlib import Path
-
-        hook = ImageInputHook()
-        image_path = Path("/path/to/image.jpg")
-
-        result = hook.process(image_path)
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.IMAGE
-        assert "source" in result.metadata
-
-
-class TestOutputHookEdgeCases:
-    """Test edge cases for output hooks."""
-
-    def test_video_output_hook_with_non_bytes(self):
-        """Test VideoOutputHook with non-bytes data returns empty bytes."""
-        hook = VideoOutputHook()
-        output = AgentOutput(modality=ModalityType.VIDEO, data="not bytes")
-
-        result = hook.process(output)
-        assert isinstance(result, bytes)
-        assert result == b""
-
-    def test_audio_output_hook_with_non_bytes(self):
-        """Test AudioOutputHook with non-bytes data returns empty bytes."""
-        hook = AudioOutputHook()
-        output = AgentOutput(modality=ModalityType.AUDIO, data="not bytes")
-
-        result = hook.process(output)
-        assert isinstance(result, bytes)
-        assert result == b""
-
-    def test_image_output_hook_with_non_bytes(self):
-        """Test ImageOutputHook with non-bytes data returns empty bytes."""
-        hook = ImageOutputHook()
-        output = AgentOutput(modality=ModalityType.IMAGE, data="not bytes")
-
-        result = hook.process(output)
-        assert isinstance(result, bytes)
-        assert result == b""
+    @pytest.mark.parametrize(
+        "hook_name,modality,source",
+        [
+            ("video_in", ModalityType.VIDEO, "/path/to/video.mp4"),
+            ("video_in", ModalityType.VIDEO, Path("/path/to/video.mp4")),
+            ("audio_in", ModalityType.AUDIO, Path("/path/to/audio.mp3")),
+            ("image_in", ModalityType.IMAGE, Path("/path/to/image.jpg")),
+        ],
+    )
+    def test_media_input_hook_records_source(self, hooks, hook_name, modality, source):
+        """Test media input hooks record str and Path sources in metadata."""
+        _check_input(
+            hooks[hook_name].process(source), modality, source, has_source=True
+        )
 
 
 class TestAgentGeneration:
@@ -537,84 +382,86 @@ class TestAgentGeneration:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return GeminiAgent(api_key=api_key, model_name="gemini-2.5-flash")
 
-    @pytest.mark.asyncio
-    async def test_generate_with_output_modality(self, agent_with_api):
-        """Test generate with different output modality."""
-        text_input = agent_with_api.process_input("Test", ModalityType.TEXT)
+    def test_convenience_return_types(self):
+        """Test the return-type contract of the convenience methods."""
+        assert get_type_hints(GeminiAgent.generate_text)["return"] is str
+        assert get_type_hints(GeminiAgent.generate_from_audio)["return"] is str
+        assert (
+            get_type_hints(GeminiAgent.generate_from_video)["return"]
+            == str | dict[str, Any]
+        )
+        # Returns whatever the requested output modality's hook produces
+        assert get_type_hints(GeminiAgent.generate_multimodal)["return"] is Any
 
+    async def test_generate_with_output_modality(self, agent_with_api, sample_inputs):
+        """Test generate with different output modality."""
         output = await agent_with_api.generate(
-            [text_input], output_modality=ModalityType.VIDEO
+            [sample_inputs["text"]], output_modality=ModalityType.VIDEO
         )
         assert output.modality == ModalityType.VIDEO
 
-    @pytest.mark.asyncio
-    async def test_generate_with_config(self, agent_with_api):
+    async def test_generate_with_config(self, agent_with_api, sample_inputs):
         """Test generate with generation config passed through."""
-        text_input = agent_with_api.process_input("Test", ModalityType.TEXT)
-
         output = await agent_with_api.generate(
-            [text_input], temperature=0.7, max_tokens=100, top_p=0.9
+            [sample_inputs["text"]], temperature=0.7, max_tokens=100, top_p=0.9
         )
         assert output.metadata["config"]["temperature"] == 0.7
         assert output.metadata["config"]["max_tokens"] == 100
         assert output.metadata["config"]["top_p"] == 0.9
 
-    @pytest.mark.asyncio
-    async def test_generate_with_multiple_inputs(self, agent_with_api):
+    async def test_generate_with_multiple_inputs(self, agent_with_api, sample_inputs):
         """Test generate with multiple inputs."""
-        text_input = agent_with_api.process_input("Describe this", ModalityType.TEXT)
-        video_input = agent_with_api.process_input(b"video data", ModalityType.VIDEO)
-        image_input = agent_with_api.process_input(b"image data", ModalityType.IMAGE)
-
-        output = await agent_with_api.generate([text_input, video_input, image_input])
+        output = await agent_with_api.generate(
+            [sample_inputs["text"], sample_inputs["video"], sample_inputs["image"]]
+        )
         assert output.metadata["inputs"] == 3
 
-    @pytest.mark.asyncio
-    async def test_generate_text_with_context(self, agent_with_api):
+    async def test_generate_text_with_context(self, agent_with_api, sample_inputs):
         """Test generate_text with additional context inputs."""
-        image_input = agent_with_api.process_input(b"image data", ModalityType.IMAGE)
-
         result = await agent_with_api.generate_text(
-            "What's in this image?", context_inputs=[image_input]
+            "What's in this image?", context_inputs=[sample_inputs["image"]]
         )
         assert isinstance(result, str)
-
-    @pytest.mark.asyncio
-    async def test_generate_from_video_with_bytes(self, agent_with_api):
-        """Test generate_from_video with bytes input."""
-        video_bytes = b"fake video data"
-
-        result = await agent_with_api.generate_from_video(video_bytes, "Describe this")
-        assert isinstance(result, str)
-
-    @pytest.mark.asyncio
-    async def test_generate_from_audio_with_bytes(self, agent_with_api):
-        """Test generate_from_audio with bytes input."""
-        audio_bytes = b"fake audio data"
-
-        result = await agent_with_api.generate_from_audio(
-            audio_bytes, "Transcribe this"
-        )
+        assert result.strip()
+
+    @pytest.mark.parametrize(
+        "method,args,kwargs",
+        [
+            ("generate_text", ("What is AI?",), {}),
+            ("generate_from_video", ("/path/to/video.mp4", "Describe this video"), {}),
+            ("generate_from_video", (FAKE_VIDEO, "Describe this"), {}),
+            ("generate_from_audio", ("/path/to/audio.mp3", "Transcribe this"), {}),
+            ("generate_from_audio", (FAKE_AUDIO, "Transcribe this"), {}),
+            (
+                "generate_multimodal",
+                (),
+                {
+                    "text_prompts": ["Analyze these"],
+                    "images": ["/path/to/img1.jpg", "/path/to/img2.jpg"],
+                    "videos": ["/path/to/video.mp4"],
+                    "audios": ["/path/to/audio.mp3"],
+                },
+            ),
+            (
+                "generate_multimodal",
+                (),
+                {
+                    "text_prompts": ["First prompt", "Second prompt"],
+                    "images": ["img1.jpg", "img2.jpg"],
+                    "videos": ["vid.mp4"],
+                    "audios": ["aud.mp3"],
+                },
+            ),
+            ("generate_multimodal", (), {"text_prompts": ["Just text"]}),
+        ],
+    )
+    async def test_convenience_methods_return_text(
+        self, agent_with_api, method, args, kwargs
+    ):
+        """Test each text-returning convenience method."""
+        result = await getattr(agent_with_api, method)(*args, **kwargs)
         assert isinstance(result, str)
 
-    @pytest.mark.asyncio
-    async def test_generate_multimodal_with_all_modalities(self, agent_with_api):
-        """Test generate_multimodal with all input types."""
-        result = await agent_with_api.generate_multimodal(
-            text_prompts=["First prompt", "Second prompt"],
-            images=["img1.jpg", "img2.jpg"],
-            videos=["vid.mp4"],
-            audios=["aud.mp3"],
-        )
-        assert isinstance(result, str)
-
-    @pytest.mark.asyncio
-    async def test_generate_multimodal_text_only(self, agent_with_api):
-        """Test generate_multimodal with only text."""
-        result = await agent_with_api.generate_multimodal(text_prompts=["Just text"])
-        assert isinstance(result, str)
-
-    @pytest.mark.asyncio
     async def test_generate_multimodal_with_video_output(self, agent_with_api):
         """Test generate_multimodal requesting video output."""
         result = await agent_with_api.generate_multimodal(
@@ -628,45 +475,33 @@ class TestAgentGeneration:
 class TestAgentProcessing:
     """Test agent processing methods."""
 
-    def test_process_input_audio(self):
+    def test_process_input_audio(self, shared_agent):
         """Test processing audio input."""
-        agent = GeminiAgent()
-        result = agent.process_input(b"audio data", ModalityType.AUDIO)
-
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.AUDIO
+        result = shared_agent.process_input(b"audio data", ModalityType.AUDIO)
+        _check_input(result, ModalityType.AUDIO, b"audio data")
 
-    def test_process_input_image(self):
+    def test_process_input_image(self, shared_agent):
         """Test processing image input."""
-        agent = GeminiAgent()
-        result = agent.process_input("image.jpg", ModalityType.IMAGE)
+        result = shared_agent.process_input("image.jpg", ModalityType.IMAGE)
+        _check_input(result, ModalityType.IMAGE, "image.jpg", has_source=True)
 
-        assert isinstance(result, AgentInput)
-        assert result.modality == ModalityType.IMAGE
-
-    def test_process_output_video(self):
+    def test_process_output_video(self, shared_agent):
         """Test processing video output."""
-        agent = GeminiAgent()
         output = AgentOutput(modality=ModalityType.VIDEO, data=b"video bytes")
 
-        result = agent.process_output(output)
-        assert isinstance(result, bytes)
+        _check_output(shared_agent.process_output(output), output.data)
 
-    def test_process_output_audio(self):
+    def test_process_output_audio(self, shared_agent):
         """Test processing audio output."""
-        agent = GeminiAgent()
         output = AgentOutput(modality=ModalityType.AUDIO, data=b"audio bytes")
 
-        result = agent.process_output(output)
-        assert isinstance(result, bytes)
+        _check_output(shared_agent.process_output(output), output.data)
 
-    def test_process_output_image(self):
+    def test_process_output_image(self, shared_agent):
         """Test processing image output."""
-        agent = GeminiAgent()
         output = AgentOutput(modality=ModalityType.IMAGE, data=b"image bytes")
 
-        result = agent.process_output(output)
-        assert isinstance(result, bytes)
+        _check_output(shared_agent.process_output(output), output.data)
 
 
 class TestAgentInitialization:
@@ -723,7 +558,6 @@ class TestEndToEndGeminiAPI:
             model_name="gemini-2.5-flash-native-audio-preview-09-2025",
         )
 
-    @pytest.mark.asyncio
     async def test_e2e_simple_text_generation(self, agent):
         """Test simple text generation with real API."""
         response = await agent.generate_text(
@@ -735,7 +569,6 @@ class TestEndToEndGeminiAPI:
         assert "4" in response
         print(f"\n✅ E2E Test - Simple text generation: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_text_generation_with_instructions(self, agent):
         """Test text generation with specific instructions."""
         response = await agent.generate_text(
@@ -749,7 +582,6 @@ class TestEndToEndGeminiAPI:
         assert len(lines) >= 3
         print(f"\n✅ E2E Test - Haiku generation:\n{response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_text_generation_with_config(self, agent):
         """Test text generation with custom config."""
         text_input = agent.process_input(
@@ -766,7 +598,6 @@ class TestEndToEndGeminiAPI:
         assert response.metadata["model"] == "gemini-2.5-flash"
         print(f"\n✅ E2E Test - Text with config: {response.data}")
 
-    @pytest.mark.asyncio
     async def test_e2e_math_reasoning(self, agent):
         """Test mathematical reasoning."""
         response = await agent.generate_text(
@@ -777,7 +608,6 @@ class TestEndToEndGeminiAPI:
         assert "120" in response
         print(f"\n✅ E2E Test - Math reasoning: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_code_generation(self, agent):
         """Test code generation."""
         response = await agent.generate_text(
@@ -788,7 +618,6 @@ class TestEndToEndGeminiAPI:
         assert "def" in response.lower() or "factorial" in response.lower()
         print(f"\n✅ E2E Test - Code generation:\n{response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_multimodal_text_only(self, agent):
         """Test multimodal method with text only."""
         response = await agent.generate_multimodal(
@@ -800,7 +629,6 @@ class TestEndToEndGeminiAPI:
         assert "python" in response.lower()
         print(f"\n✅ E2E Test - Multimodal text only: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_multiple_text_prompts(self, agent):
         """Test with multiple text prompts."""
         response = await agent.generate_multimodal(
@@ -815,7 +643,6 @@ class TestEndToEndGeminiAPI:
         assert "paris" in response.lower()
         print(f"\n✅ E2E Test - Multiple prompts: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_agent_without_api_key_raises_error(self):
         """Test that agent without API key raises appropriate error."""
         agent = GeminiAgent(api_key=None, model_name="gemini-2.5-flash")
@@ -825,7 +652,6 @@ class TestEndToEndGeminiAPI:
         with pytest.raises(ValueError, match="Model not initialized"):
             await agent.generate_text("Test prompt")
 
-    @pytest.mark.asyncio
     async def test_e2e_creative_writing(self, agent):
         """Test creative writing capabilities."""
         response = await agent.generate_text(
@@ -836,7 +662,6 @@ class TestEndToEndGeminiAPI:
         assert len(response) > 20  # Should be a reasonable sentence
         print(f"\n✅ E2E Test - Creative writing: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_json_output(self, agent):
         """Test structured JSON output."""
         response = await agent.generate_text(
@@ -847,7 +672,6 @@ class TestEndToEndGeminiAPI:
         assert "{" in response and "}" in response
         print(f"\n✅ E2E Test - JSON output: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_image_url_input(self, agent):
         """Test image understanding with URL."""
         # Using a public image URL
@@ -867,7 +691,6 @@ class TestEndToEndGeminiAPI:
         assert len(response) > 10
         print(f"\n✅ E2E Test - Image understanding: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_text_to_text(self, agent):
         """Test 1: text -> text conversion."""
         response = await agent.generate_text(
@@ -879,11 +702,8 @@ class TestEndToEndGeminiAPI:
         assert "neural" in response.lower() or "network" in response.lower()
         print(f"\n✅ E2E Test - Text to Text: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_multiple_videos_text_to_text(self, agent):
         """Test 2: multiple videos + text -> text conversion."""
-        from pathlib import Path
-
         # Get paths to test videos
         test_dir = Path(__file__).parent / "assets"
         video1_path = test_dir / "test_video1.mp4"
@@ -911,11 +731,8 @@ class TestEndToEndGeminiAPI:
         assert len(response) > 30
         print(f"\n✅ E2E Test - Multiple Videos + Text to Text: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_video_text_to_audio(self, audio_agent):
         """Test 3: video + text -> audio conversion with audio-capable model."""
-        from pathlib import Path
-
         # Get path to test video
         test_dir = Path(__file__).parent / "assets"
         video_path = test_dir / "test_video1.mp4"
@@ -954,11 +771,8 @@ class TestEndToEndGeminiAPI:
             f.write(audio_data)
         print(f"   Audio saved to: {output_path}")
 
-    @pytest.mark.asyncio
     async def test_e2e_multimodal_video_and_text_to_text(self, agent):
         """Test: Single video + text -> text using convenience method."""
-        from pathlib import Path
-
         # Get path to test video
         test_dir = Path(__file__).parent / "assets"
         video_path = test_dir / "test_video1.mp4"
@@ -975,11 +789,8 @@ class TestEndToEndGeminiAPI:
         assert len(response) > 10
         print(f"\n✅ E2E Test - Single Video + Text to Text: {response}")
 
-    @pytest.mark.asyncio
     async def test_e2e_multimodal_comprehensive(self, agent):
         """Test: Comprehensive multimodal test with multiple inputs."""
-        from pathlib import Path
-
         test_dir = Path(__file__).parent / "assets"
         video1_path = test_dir / "test_video1.mp4"
         video2_path = test_dir / "test_video2.mp4"
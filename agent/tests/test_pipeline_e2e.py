@@ -4,18 +4,115 @@ End-to-end tests for the video processing pipeline.
 These tests verify that the sliding window pipeline works for highlight detection.
 """
 
+import asyncio
+import base64
 import json
-from unittest.mock import Mock, patch
+import shutil
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.api import (
+    _build_complete_dict,
+    _build_error_dict,
+    _build_snippet_dict,
     create_complete_message,
     create_error_message,
+    create_snippet_header_message,
     create_snippet_message,
 )
 from src.pipeline import SlidingWindowPipeline, create_highlight_pipeline
 
+# Message callables every process_video_url call is wired with
+_MSG_FACTORIES = {
+    "create_snippet_message": create_snippet_message,
+    "create_complete_message": create_complete_message,
+    "create_error_message": create_error_message,
+}
+
+# Placeholder stream chunks, built once at import and sliced by tests that need fewer
+_CHUNKS_6 = tuple(f"chunk_{i}".encode() for i in range(6))
+_CHUNKS_10 = tuple(f"chunk_{i}".encode() for i in range(10))
+
+
+@dataclass(frozen=True)
+class WindowScenario:
+    """One sliding-window run: pipeline settings, stream length and expectations."""
+
+    window_size: int
+    slide_step: int
+    n_chunks: int
+    expected_starts: tuple[int, ...]
+    base_chunk_duration: int = 2
+    highlight_starts: frozenset[int] = frozenset()
+    expected_msg_types: tuple[str, ...] = ("snippet_complete",)
+
+
+class SendRecorder:
+    """
+    WebSocket stand-in that records every message sent to it.
+
+    Text frames are parsed once on arrival so assertions work on dicts;
+    binary frames are kept as bytes. Pass parse=False to keep text frames
+    raw, e.g. to inspect newline-batched snippets.
+    """
+
+    __slots__ = ("_parse", "sent")
+
+    def __init__(self, parse=True):
+        self.sent = []
+        self._parse = parse
+
+    def send(self, message):
+        if self._parse and isinstance(message, str):
+            message = json.loads(message)
+        self.sent.append(message)
+
+
+@pytest.fixture
+def ws():
+    """Fresh SendRecorder for each test."""
+    return SendRecorder()
+
+
+@pytest.fixture
+def stub_stream(monkeypatch):
+    """Replace the video download with a fixed sequence of chunks."""
+
+    def _stub(chunks):
+        monkeypatch.setattr(
+            "src.pipeline.stream_and_chunk_video",
+            lambda *_a, **_kw: iter(chunks),
+        )
+
+    return _stub
+
+
+@pytest.fixture(scope="module")
+def _module_pipeline():
+    """Default pipeline shared by the step-setter tests in this module."""
+    return SlidingWindowPipeline()
+
+
+@pytest.fixture
+def reset_pipeline(_module_pipeline):
+    """Shared default pipeline, with its steps cleared after each test."""
+    yield _module_pipeline
+    _module_pipeline.detect_step = None
+    _module_pipeline.trim_step = None
+    _module_pipeline.caption_step = None
+
+
+@pytest.fixture(scope="module")
+def pipeline_factory():
+    """Build SlidingWindowPipelines; tests pass only the settings they care about."""
+
+    def _make(**kwargs):
+        return SlidingWindowPipeline(**kwargs)
+
+    return _make
+
 
 class TestSlidingWindowPipelineUnit:
     """Unit tests for the SlidingWindowPipeline class."""
@@ -40,47 +137,41 @@ class TestSlidingWindowPipelineUnit:
         assert pipeline.window_size == 5
         assert pipeline.slide_step == 1
 
-    def test_set_detect_step(self):
+    def test_set_detect_step(self, reset_pipeline):
         """Test setting the detect step function."""
-        pipeline = SlidingWindowPipeline()
 
         def dummy_detect(chunks, metadata):
             return True, metadata
 
-        pipeline.set_detect_step(dummy_detect)
-        assert pipeline.detect_step == dummy_detect
+        reset_pipeline.set_detect_step(dummy_detect)
+        assert reset_pipeline.detect_step is dummy_detect
 
-    def test_set_trim_step(self):
+    def test_set_trim_step(self, reset_pipeline):
         """Test setting the trim step function."""
-        pipeline = SlidingWindowPipeline()
 
         def dummy_trim(chunks, metadata):
             return b"trimmed", metadata
 
-        pipeline.set_trim_step(dummy_trim)
-        assert pipeline.trim_step == dummy_trim
+        reset_pipeline.set_trim_step(dummy_trim)
+        assert reset_pipeline.trim_step is dummy_trim
 
-    def test_set_caption_step(self):
+    def test_set_caption_step(self, reset_pipeline):
         """Test setting the caption step function."""
-        pipeline = SlidingWindowPipeline()
 
         def dummy_caption(data, metadata):
             return "title", "description", metadata
 
-        pipeline.set_caption_step(dummy_caption)
-        assert pipeline.caption_step == dummy_caption
+        reset_pipeline.set_caption_step(dummy_caption)
+        assert reset_pipeline.caption_step is dummy_caption
 
     def test_concatenate_chunks_single_chunk(self):
         """Test concatenating a single chunk returns it unchanged."""
-        pipeline = SlidingWindowPipeline()
-        chunks = [b"single_chunk"]
-        result = pipeline._concatenate_chunks(chunks)
+        result = SlidingWindowPipeline._concatenate_chunks([b"single_chunk"])
         assert result == b"single_chunk"
 
     def test_concatenate_chunks_empty(self):
         """Test concatenating empty list returns empty bytes."""
-        pipeline = SlidingWindowPipeline()
-        result = pipeline._concatenate_chunks([])
+        result = SlidingWindowPipeline._concatenate_chunks([])
         assert result == b""
 
     def test_create_highlight_pipeline(self):
@@ -105,293 +196,521 @@ class TestSlidingWindowPipelineUnit:
         assert pipeline.slide_step == 1
 
 
+class TestMessageBuilders:
+    """The create_*_message helpers are the JSON form of the dict builders."""
+
+    def test_builders_match_serialized_messages(self):
+        """Test each builder against its serialized counterpart."""
+        url = "https://example.com/test.mp4"
+        cases = [
+            (
+                _build_snippet_dict(b"clip", url, "Title", "Desc"),
+                create_snippet_message(b"clip", url, "Title", "Desc"),
+            ),
+            (_build_complete_dict(url), create_complete_message(url)),
+            (_build_error_dict("boom", url), create_error_message("boom", url)),
+        ]
+
+        for built, serialized in cases:
+            assert json.loads(serialized) == built
+        assert [built["type"] for built, _ in cases] == [
+            "snippet",
+            "snippet_complete",
+            "error",
+        ]
+
+
 class TestSlidingWindowIntegration:
     """Integration tests for the sliding window pipeline."""
 
-    @patch("src.pipeline.stream_and_chunk_video")
-    def test_pipeline_sliding_window_logic(self, mock_stream_and_chunk):
-        """Test that pipeline correctly implements sliding window logic."""
-        pipeline = SlidingWindowPipeline(
-            base_chunk_duration=2, window_size=3, slide_step=1
+    @pytest.mark.parametrize(
+        "scenario",
+        [
+            # 6 chunks sliding by 1: windows 0-2, 1-3, 2-4, 3-5
+            WindowScenario(
+                window_size=3, slide_step=1, n_chunks=6, expected_starts=(0, 1, 2, 3)
+            ),
+            # 10 chunks sliding by 2: windows start at 0, 2, 4, 6
+            WindowScenario(
+                window_size=3, slide_step=2, n_chunks=10, expected_starts=(0, 2, 4, 6)
+            ),
+            # Highlight in window 0 skips past it, so windows 1 and 2 never run
+            WindowScenario(
+                window_size=3,
+                slide_step=1,
+                n_chunks=6,
+                highlight_starts=frozenset({0}),
+                expected_starts=(0, 3),
+                expected_msg_types=("snippet", "snippet_complete"),
+            ),
+            # Exactly one window's worth of chunks
+            WindowScenario(
+                window_size=3, slide_step=2, n_chunks=3, expected_starts=(0,)
+            ),
+            # A trailing partial window is never handed to detect
+            WindowScenario(
+                window_size=3, slide_step=2, n_chunks=4, expected_starts=(0,)
+            ),
+        ],
+        ids=["slide-1", "slide-2", "highlight-skip", "single-window", "short-tail"],
+    )
+    async def test_window_scenarios(self, scenario, pipeline_factory, ws, stub_stream):
+        """Test which windows are visited, their metadata and what gets sent."""
+        stub_stream(_CHUNKS_10[: scenario.n_chunks])
+        pipeline = pipeline_factory(
+            base_chunk_duration=scenario.base_chunk_duration,
+            window_size=scenario.window_size,
+            slide_step=scenario.slide_step,
         )
 
-        # Create mock chunks (simulate 6 chunks = 12 seconds of video)
-        mock_chunks = [
-            b"chunk_0",
-            b"chunk_1",
-            b"chunk_2",
-            b"chunk_3",
-            b"chunk_4",
-            b"chunk_5",
-        ]
-        mock_stream_and_chunk.return_value = iter(mock_chunks)
+        captured_metadata = []
+        chunks_per_window = []
 
-        # Track which windows were processed
-        processed_windows = []
+        def detect(chunks, metadata):
+            captured_metadata.append(metadata.copy())
+            chunks_per_window.append(len(chunks))
+            return metadata["window_start_chunk"] in scenario.highlight_starts, metadata
 
-        def track_detect(chunks, metadata):
-            processed_windows.append(
-                (metadata["window_start_chunk"], metadata["window_end_chunk"])
-            )
-            # No highlights detected
-            return False, metadata
+        def dummy_trim(chunks, metadata):
+            return b"trimmed_video", metadata
 
-        pipeline.set_detect_step(track_detect)
+        def dummy_caption(data, metadata):
+            return "Test Highlight", "Test Description", metadata
+
+        pipeline.set_detect_step(detect)
+        pipeline.set_trim_step(dummy_trim)
+        pipeline.set_caption_step(dummy_caption)
 
-        mock_ws = Mock()
         test_url = "https://example.com/test.mp4"
 
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
+        await pipeline.process_video_url(
             video_url=test_url,
-            ws=mock_ws,
+            ws=ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
-
-        # With 6 chunks, window_size=3, slide_step=1, we should process:
-        # Window 0-2, 1-3, 2-4, 3-5 (4 windows)
-        assert len(processed_windows) == 4
-        assert processed_windows[0] == (0, 2)
-        assert processed_windows[1] == (1, 3)
-        assert processed_windows[2] == (2, 4)
-        assert processed_windows[3] == (3, 5)
-
-        # Should only send completion message (no highlights)
-        assert mock_ws.send.call_count == 1
-        last_msg = json.loads(mock_ws.send.call_args_list[-1][0][0])
+            **_MSG_FACTORIES,
+        )
+
+        assert [m["window_start_chunk"] for m in captured_metadata] == list(
+            scenario.expected_starts
+        )
+        assert all(n == scenario.window_size for n in chunks_per_window)
+
+        duration = scenario.base_chunk_duration
+        for metadata in captured_metadata:
+            start = metadata["window_start_chunk"]
+            end = start + scenario.window_size - 1
+            assert metadata["src_video_url"] == test_url
+            assert metadata["window_end_chunk"] == end
+            assert metadata["window_start_time"] == start * duration
+            assert metadata["window_end_time"] == (end + 1) * duration
+            assert metadata["base_chunk_duration"] == duration
+
+        sent_types = tuple(m["type"] for m in ws.sent)
+        assert sent_types == scenario.expected_msg_types
+
+    async def test_pipeline_batches_snippet_messages(
+        self, pipeline_factory, stub_stream
+    ):
+        """Test that snippets are coalesced into one newline-delimited frame."""
+        pipeline = pipeline_factory(
+            base_chunk_duration=2, window_size=3, slide_step=1, snippet_batch_size=2
+        )
+        ws = SendRecorder(parse=False)
+        stub_stream(_CHUNKS_6)
+
+        def detect_every_window(chunks, metadata):
+            return True, metadata
+
+        def dummy_trim(chunks, metadata):
+            return b"trimmed_video", metadata
+
+        pipeline.set_detect_step(detect_every_window)
+        pipeline.set_trim_step(dummy_trim)
+
+        await pipeline.process_video_url(
+            video_url="https://example.com/test.mp4",
+            ws=ws,
+            is_live=False,
+            **_MSG_FACTORIES,
+        )
+
+        # Windows 0 and 3 are highlights: one batched frame + completion
+        assert len(ws.sent) == 2
+        batch = ws.sent[0].split("\n")
+        assert [json.loads(msg)["type"] for msg in batch] == ["snippet", "snippet"]
+
+        last_msg = json.loads(ws.sent[-1])
         assert last_msg["type"] == "snippet_complete"
 
-    @patch("src.pipeline.stream_and_chunk_video")
-    def test_pipeline_highlight_detection_and_skip(self, mock_stream_and_chunk):
-        """Test that pipeline skips window when highlight is detected."""
-        pipeline = SlidingWindowPipeline(
-            base_chunk_duration=2, window_size=3, slide_step=1
+    async def test_pipeline_reports_failed_snippet_flush(
+        self, pipeline_factory, stub_stream
+    ):
+        """Test that snippets lost to a broken connection aren't silently dropped."""
+        pipeline = pipeline_factory(
+            base_chunk_duration=2, window_size=3, slide_step=1, snippet_batch_size=2
         )
+        stub_stream(_CHUNKS_6)
+        sent = []
+
+        def send(message):
+            # Snippet batches are newline-delimited; everything else is one message
+            batch = [json.loads(part) for part in message.split("\n")]
+            if batch[0]["type"] == "snippet":
+                raise ConnectionError("connection lost")
+            sent.extend(batch)
+
+        def trim_once(chunks, metadata):
+            if metadata["window_start_chunk"] > 0:
+                raise RuntimeError("trim failed")
+            return b"trimmed_video", metadata
 
-        # Create mock chunks
-        mock_chunks = [
-            b"chunk_0",
-            b"chunk_1",
-            b"chunk_2",
-            b"chunk_3",
-            b"chunk_4",
-            b"chunk_5",
-        ]
-        mock_stream_and_chunk.return_value = iter(mock_chunks)
+        pipeline.set_detect_step(lambda chunks, metadata: (True, metadata))
+        pipeline.set_trim_step(trim_once)
+
+        await pipeline.process_video_url(
+            video_url="https://example.com/test.mp4",
+            ws=Mock(send=send),
+            is_live=False,
+            **_MSG_FACTORIES,
+        )
 
-        processed_windows = []
+        # The failed flush is what gets reported, not just the trim error
+        assert [msg["type"] for msg in sent] == ["error"]
+        assert sent[0]["message"] == "connection lost"
 
-        def detect_first_window(chunks, metadata):
-            window_start = metadata["window_start_chunk"]
-            processed_windows.append(window_start)
-            # Detect highlight only in first window
-            return window_start == 0, metadata
+    async def test_pipeline_sends_binary_snippets(
+        self, pipeline_factory, ws, stub_stream
+    ):
+        """Test that binary mode sends a JSON header followed by the raw bytes."""
+        pipeline = pipeline_factory(base_chunk_duration=2, window_size=3, slide_step=1)
+        stub_stream(_CHUNKS_6[:3])
+
+        def detect_highlight(chunks, metadata):
+            return True, metadata
 
         def dummy_trim(chunks, metadata):
             return b"trimmed_video", metadata
 
-        def dummy_caption(data, metadata):
-            return "Test Highlight", "Test Description", metadata
-
-        pipeline.set_detect_step(detect_first_window)
+        pipeline.set_detect_step(detect_highlight)
         pipeline.set_trim_step(dummy_trim)
-        pipeline.set_caption_step(dummy_caption)
 
-        mock_ws = Mock()
-        test_url = "https://example.com/test.mp4"
-
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
-            video_url=test_url,
-            ws=mock_ws,
+        await pipeline.process_video_url(
+            video_url="https://example.com/test.mp4",
+            ws=ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
-
-        # Should process: window 0 (highlight, skip to 3), then 3
-        # Windows processed: 0, 3
-        assert 0 in processed_windows
-        assert 3 in processed_windows
-        # Should NOT process windows 1, 2 (skipped due to highlight)
-        assert 1 not in processed_windows
-        assert 2 not in processed_windows
-
-        # Should send: 1 highlight + 1 completion
-        assert mock_ws.send.call_count == 2
-
-        # First message should be the highlight
-        first_msg = json.loads(mock_ws.send.call_args_list[0][0][0])
-        assert first_msg["type"] == "snippet"
-
-        # Last message should be completion
-        last_msg = json.loads(mock_ws.send.call_args_list[-1][0][0])
+            **_MSG_FACTORIES,
+            create_snippet_header_message=create_snippet_header_message,
+        )
+
+        # Header + binary payload + completion
+        assert len(ws.sent) == 3
+        header = ws.sent[0]
+        assert header["type"] == "snippet_header"
+        assert header["data"]["video_length_bytes"] == len(b"trimmed_video")
+        assert ws.sent[1] == b"trimmed_video"
+
+        last_msg = ws.sent[-1]
         assert last_msg["type"] == "snippet_complete"
 
-    @patch("src.pipeline.stream_and_chunk_video")
-    def test_pipeline_metadata_tracking(self, mock_stream_and_chunk):
-        """Test that pipeline correctly tracks metadata for windows."""
-        pipeline = SlidingWindowPipeline(base_chunk_duration=2, window_size=3)
+    async def test_header_and_payload_not_interleaved(self, pipeline_factory):
+        """Test that a concurrent send can't land between a header and its bytes."""
+        pipeline = pipeline_factory()
+        sent = []
 
-        mock_chunks = [b"chunk_0", b"chunk_1", b"chunk_2"]
-        mock_stream_and_chunk.return_value = iter(mock_chunks)
+        async def send(message):
+            # Yield to the loop mid-send, as a real socket write would
+            await asyncio.sleep(0)
+            sent.append(message)
 
-        captured_metadata = []
+        mock_ws = Mock()
+        mock_ws.send = send
 
-        def capture_metadata(chunks, metadata):
-            captured_metadata.append(metadata.copy())
+        await asyncio.gather(
+            pipeline._send(mock_ws, "header", b"payload"),
+            pipeline._send(mock_ws, "live_commentary"),
+        )
+
+        assert sent == ["header", b"payload", "live_commentary"]
+
+    def test_pipeline_reusable_across_event_loops(self, pipeline_factory, stub_stream):
+        """Test that one pipeline can serve runs on successive event loops."""
+        pipeline = pipeline_factory(base_chunk_duration=2, window_size=3, slide_step=1)
+        stub_stream(_CHUNKS_6[:3])
+        pipeline.set_detect_step(lambda chunks, metadata: (False, metadata))
+
+        async def send(message):
+            await asyncio.sleep(0)
+
+        async def run_once():
+            mock_ws = Mock()
+            mock_ws.send = send
+            await pipeline.process_video_url(
+                video_url="https://example.com/test.mp4",
+                ws=mock_ws,
+                is_live=False,
+                **_MSG_FACTORIES,
+            )
+            # Contended sends make the lock wait on this run's loop
+            await asyncio.gather(
+                pipeline._send(mock_ws, "first"), pipeline._send(mock_ws, "second")
+            )
+
+        asyncio.run(run_once())
+        asyncio.run(run_once())
+
+    async def test_pipeline_awaits_async_websocket_send(
+        self, pipeline_factory, stub_stream
+    ):
+        """Test that an async ws.send is awaited on the event loop directly."""
+        pipeline = pipeline_factory(base_chunk_duration=2, window_size=3, slide_step=1)
+        stub_stream(_CHUNKS_6[:3])
+
+        def detect_no_highlight(chunks, metadata):
             return False, metadata
 
-        pipeline.set_detect_step(capture_metadata)
+        pipeline.set_detect_step(detect_no_highlight)
 
         mock_ws = Mock()
-        test_url = "https://example.com/test.mp4"
+        mock_ws.send = AsyncMock()
 
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
-            video_url=test_url,
+        await pipeline.process_video_url(
+            video_url="https://example.com/test.mp4",
             ws=mock_ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
+            **_MSG_FACTORIES,
+        )
 
-        # Should have processed 1 window (0-2)
-        assert len(captured_metadata) == 1
+        mock_ws.send.assert_awaited_once()
+        last_msg = json.loads(mock_ws.send.await_args[0][0])
+        assert last_msg["type"] == "snippet_complete"
 
-        metadata = captured_metadata[0]
-        assert metadata["src_video_url"] == test_url
-        assert metadata["window_start_chunk"] == 0
-        assert metadata["window_end_chunk"] == 2
-        assert metadata["window_start_time"] == 0
-        assert metadata["window_end_time"] == 6  # 3 chunks * 2 seconds
-        assert metadata["base_chunk_duration"] == 2
 
+@pytest.mark.serial
+class TestVideoPipelineIntegration:
+    """Integration tests that run the pipeline over a real ffmpeg-generated MP4."""
 
-class TestPipelineErrorHandling:
-    """Test error handling in the pipeline."""
+    async def test_pipeline_processes_video_and_sends_chunks(
+        self, test_mp4_bytes, pipeline_factory, ws, stub_stream
+    ):
+        """Test that a highlight built from real MP4 chunks is sent intact."""
 
-    def test_pipeline_sends_error_on_invalid_url(self):
-        """Test that invalid URL triggers error message."""
-        pipeline = SlidingWindowPipeline()
-        mock_ws = Mock()
+        mv = memoryview(test_mp4_bytes)
+        half = len(mv) // 2
+        chunk1, chunk2 = bytes(mv[:half]), bytes(mv[half:])
+        stub_stream((chunk1, chunk2))
 
-        invalid_url = (
-            "https://this-domain-definitely-does-not-exist-12345.com/video.mp4"
+        pipeline = pipeline_factory(base_chunk_duration=3, window_size=2, slide_step=1)
+
+        def detect_highlight(chunks, metadata):
+            return True, metadata
+
+        def join_chunks(chunks, metadata):
+            return b"".join(chunks), metadata
+
+        pipeline.set_detect_step(detect_highlight)
+        pipeline.set_trim_step(join_chunks)
+
+        await pipeline.process_video_url(
+            video_url="https://example.com/test.mp4",
+            ws=ws,
+            is_live=False,
+            **_MSG_FACTORIES,
         )
 
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
-            video_url=invalid_url,
-            ws=mock_ws,
+        assert len(ws.sent) == 2
+        snippet = ws.sent[0]
+        assert snippet["type"] == "snippet"
+        assert base64.b64decode(snippet["data"]["video_data"]) == test_mp4_bytes
+
+        last_msg = ws.sent[-1]
+        assert last_msg["type"] == "snippet_complete"
+
+    async def test_pipeline_with_modulation_functions(
+        self, test_mp4_bytes, pipeline_factory, ws, stub_stream
+    ):
+        """Test that detect/trim/caption steps can pass data through metadata."""
+
+        mv = memoryview(test_mp4_bytes)
+        half = len(mv) // 2
+        stub_stream((bytes(mv[:half]), bytes(mv[half:])))
+
+        pipeline = pipeline_factory(base_chunk_duration=3, window_size=2, slide_step=1)
+
+        def detect_with_score(chunks, metadata):
+            metadata["score"] = sum(len(chunk) for chunk in chunks)
+            return True, metadata
+
+        def trim_first_chunk(chunks, metadata):
+            metadata["trimmed_to"] = len(chunks[0])
+            return chunks[0], metadata
+
+        def caption_from_metadata(video_data, metadata):
+            title = f"Score {metadata['score']}"
+            description = f"Trimmed to {metadata['trimmed_to']} bytes"
+            return title, description, metadata
+
+        pipeline.set_detect_step(detect_with_score)
+        pipeline.set_trim_step(trim_first_chunk)
+        pipeline.set_caption_step(caption_from_metadata)
+
+        await pipeline.process_video_url(
+            video_url="https://example.com/test.mp4",
+            ws=ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
+            **_MSG_FACTORIES,
+        )
 
-        # Should send error message
-        assert mock_ws.send.called
-        last_msg = json.loads(mock_ws.send.call_args_list[-1][0][0])
-        assert last_msg["type"] == "error"
+        snippet = ws.sent[0]
+        assert snippet["data"]["metadata"]["title"] == f"Score {len(test_mp4_bytes)}"
+        assert snippet["data"]["metadata"]["description"] == f"Trimmed to {half} bytes"
 
-    @patch("src.pipeline.stream_and_chunk_video")
-    def test_pipeline_handles_processing_error(self, mock_stream_and_chunk):
-        """Test that pipeline handles errors during processing."""
-        pipeline = SlidingWindowPipeline()
 
-        # Make stream fail
-        mock_stream_and_chunk.side_effect = Exception("Download failed")
+@pytest.mark.serial
+@pytest.mark.real_stream
+@pytest.mark.skipif(shutil.which("yt-dlp") is None, reason="yt-dlp not installed")
+class TestPipelineE2E:
+    """End-to-end tests that download and chunk a video served from localhost."""
 
-        mock_ws = Mock()
-        test_url = "https://example.com/test.mp4"
+    async def test_e2e_short_video_processing(
+        self, local_video_url, pipeline_factory, ws
+    ):
+        """Test the full download, chunk and send path on a real MP4."""
+        pipeline = pipeline_factory(base_chunk_duration=2, window_size=1, slide_step=1)
 
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
-            video_url=test_url,
-            ws=mock_ws,
+        def detect_highlight(chunks, metadata):
+            return True, metadata
+
+        pipeline.set_detect_step(detect_highlight)
+
+        await pipeline.process_video_url(
+            video_url=local_video_url,
+            ws=ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
+            **_MSG_FACTORIES,
+        )
 
-        # Error message should be sent
-        last_msg = json.loads(mock_ws.send.call_args_list[-1][0][0])
-        assert last_msg["type"] == "error"
+        last_msg = ws.sent[-1]
+        assert last_msg["type"] == "snippet_complete", last_msg
 
+        snippet_messages = ws.sent[:-1]
+        assert snippet_messages
+        assert all(msg["type"] == "snippet" for msg in snippet_messages)
 
-class TestPipelineBasicFunctionality:
-    """Basic functional tests to validate core assumptions."""
+        # base64-decode just one snippet to check the payload is a real MP4
+        first = snippet_messages[0]
+        assert b"ftyp" in base64.b64decode(first["data"]["video_data"])[:100]
 
-    @patch("src.pipeline.stream_and_chunk_video")
-    def test_chunks_collected_correctly(self, mock_stream_and_chunk):
-        """Validate that all chunks are collected before processing."""
-        pipeline = SlidingWindowPipeline()
+    async def test_e2e_with_modulation(self, local_video_url, pipeline_factory, ws):
+        """Test that custom steps see real chunks and shape the sent snippet."""
+        pipeline = pipeline_factory(base_chunk_duration=2, window_size=1, slide_step=1)
 
-        mock_chunks = [b"chunk_0", b"chunk_1", b"chunk_2", b"chunk_3"]
-        mock_stream_and_chunk.return_value = iter(mock_chunks)
+        def detect_first_window(chunks, metadata):
+            return metadata["window_start_chunk"] == 0, metadata
 
-        chunk_count_in_detect = []
+        def keep_window(chunks, metadata):
+            metadata["window_bytes"] = len(chunks[0])
+            return chunks[0], metadata
 
-        def count_chunks(chunks, metadata):
-            chunk_count_in_detect.append(len(chunks))
-            return False, metadata
+        def caption_with_size(video_data, metadata):
+            return "First window", f"{metadata['window_bytes']} bytes", metadata
 
-        pipeline.set_detect_step(count_chunks)
+        pipeline.set_detect_step(detect_first_window)
+        pipeline.set_trim_step(keep_window)
+        pipeline.set_caption_step(caption_with_size)
 
-        mock_ws = Mock()
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
-            video_url="https://example.com/test.mp4",
-            ws=mock_ws,
+        await pipeline.process_video_url(
+            video_url=local_video_url,
+            ws=ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
+            **_MSG_FACTORIES,
+        )
 
-        # All detect calls should receive window_size chunks
-        assert all(count == pipeline.window_size for count in chunk_count_in_detect)
+        snippet = ws.sent[0]
+        assert snippet["type"] == "snippet", snippet
+        assert snippet["data"]["metadata"]["title"] == "First window"
+        assert snippet["data"]["metadata"]["description"].endswith(" bytes")
 
-    @patch("src.pipeline.stream_and_chunk_video")
-    def test_window_slide_behavior_without_highlight(self, mock_stream_and_chunk):
-        """Validate sliding by slide_step when no highlight."""
-        pipeline = SlidingWindowPipeline(window_size=3, slide_step=2)
+        last_msg = ws.sent[-1]
+        assert last_msg["type"] == "snippet_complete"
 
-        # Need at least 7 chunks to see multiple slides
-        mock_chunks = [f"chunk_{i}".encode() for i in range(10)]
-        mock_stream_and_chunk.return_value = iter(mock_chunks)
 
-        window_starts = []
+class TestPipelineErrorHandling:
+    """Test error handling in the pipeline."""
 
-        def track_windows(chunks, metadata):
-            window_starts.append(metadata["window_start_chunk"])
-            return False, metadata  # No highlights
+    async def test_pipeline_sends_error_on_invalid_url(
+        self, pipeline_factory, ws, monkeypatch
+    ):
+        """Test that a host that fails to resolve triggers an error message."""
 
-        pipeline.set_detect_step(track_windows)
+        def _unresolvable(*_a, **_kw):
+            raise OSError("DNS failure")
 
-        mock_ws = Mock()
-        import asyncio
-        asyncio.run(pipeline.process_video_url(
-            video_url="https://example.com/test.mp4",
-            ws=mock_ws,
+        monkeypatch.setattr("src.pipeline.stream_and_chunk_video", _unresolvable)
+        pipeline = pipeline_factory()
+        invalid_url = (
+            "https://this-domain-definitely-does-not-exist-12345.com/video.mp4"
+        )
+
+        await pipeline.process_video_url(
+            video_url=invalid_url,
+            ws=ws,
             is_live=False,
-            create_snippet_message=create_snippet_message,
-            create_complete_message=create_complete_message,
-            create_error_message=create_error_message,
-        ))
-
-        # With slide_step=2, should slide: 0, 2, 4, 6
-        assert window_starts[0] == 0
-        assert window_starts[1] == 2
-        assert window_starts[2] == 4
-        assert window_starts[3] == 6
+            **_MSG_FACTORIES,
+        )
+
+        assert len(ws.sent) == 1
+        last_msg = ws.sent[-1]
+        assert last_msg["type"] == "error"
+        assert last_msg["message"] == "DNS failure"
+
+    @pytest.mark.network
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("network")
+    async def test_pipeline_sends_error_on_unresolvable_host(
+        self, pipeline_factory, ws
+    ):
+        """Test the error path against a real DNS lookup that fails."""
+        pipeline = pipeline_factory()
+        invalid_url = (
+            "https://this-domain-definitely-does-not-exist-12345.com/video.mp4"
+        )
+
+        await pipeline.process_video_url(
+            video_url=invalid_url,
+            ws=ws,
+            is_live=False,
+            **_MSG_FACTORIES,
+        )
+
+        # Should send error message
+        assert bool(ws.sent)
+        last_msg = ws.sent[-1]
+        assert last_msg["type"] == "error"
+
+    async def test_pipeline_handles_processing_error(
+        self, pipeline_factory, ws, monkeypatch
+    ):
+        """Test that pipeline handles errors during processing."""
+        pipeline = pipeline_factory()
+
+        # Make stream fail
+        def _boom(*_a, **_kw):
+            raise RuntimeError("Download failed")
+
+        monkeypatch.setattr("src.pipeline.stream_and_chunk_video", _boom)
+
+        test_url = "https://example.com/test.mp4"
+
+        await pipeline.process_video_url(
+            video_url=test_url,
+            ws=ws,
+            is_live=False,
+            **_MSG_FACTORIES,
+        )
+
+        # Error message should be sent
+        last_msg = ws.sent[-1]
+        assert last_msg["type"] == "error"
 
 
 if __name__ == "__main__":
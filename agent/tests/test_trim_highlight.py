@@ -40,7 +40,6 @@ class TestConcatenateChunks:
         result = _concatenate_chunks([chunk])
         assert result == chunk
 
-    @pytest.mark.asyncio
     async def test_concatenate_multiple_chunks_with_real_videos(self):
         """Test concatenating multiple video chunks (integration test)."""
         # Get test video assets
@@ -124,7 +123,6 @@ class TestHighlightTrimmer:
         assert trimmer.agent is not None
         assert trimmer.prompt == TRIM_HIGHLIGHT_PROMPT
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_with_valid_response(self, trimmer):
         """Test trim_highlight with valid LLM response."""
         # Create fake video chunks
@@ -178,7 +176,6 @@ class TestHighlightTrimmer:
                 called_chunks = mock_concat.call_args[0][0]
                 assert len(called_chunks) == 5
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_with_detection_context(self, trimmer):
         """Test trim_highlight includes detection context in prompt."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -219,7 +216,6 @@ class TestHighlightTrimmer:
                     call_args
                 )
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_validates_segment_range(self, trimmer):
         """Test trim_highlight validates and fixes invalid segment ranges."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -255,7 +251,6 @@ class TestHighlightTrimmer:
                 assert result_metadata["trimmed_chunk_start"] == 3
                 assert result_metadata["trimmed_chunk_end"] == 7
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_clamps_out_of_range_segments(self, trimmer):
         """Test trim_highlight clamps segments to valid range (1-9)."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -291,7 +286,6 @@ class TestHighlightTrimmer:
                 assert result_metadata["trimmed_chunk_start"] == 1
                 assert result_metadata["trimmed_chunk_end"] == 9
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_with_unexpected_response_format(self, trimmer):
         """Test trim_highlight handles unexpected response format gracefully."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -321,7 +315,6 @@ class TestHighlightTrimmer:
                 assert result_metadata["trim_method"] == "function_call_fallback"
                 assert result_metadata["trimmed_chunk_count"] == 9
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_handles_exception(self, trimmer):
         """Test trim_highlight handles exceptions gracefully."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -352,7 +345,6 @@ class TestHighlightTrimmer:
 class TestTrimHighlightStep:
     """Test the trim_highlight_step function (pipeline integration)."""
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_step_basic(self):
         """Test trim_highlight_step function works as expected."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -377,7 +369,6 @@ class TestTrimHighlightStep:
             assert result_video == b"trimmed data"
             assert result_metadata["trimmed"] is True
 
-    @pytest.mark.asyncio
     async def test_trim_highlight_step_reuses_trimmer_instance(self):
         """Test that trim_highlight_step reuses the same trimmer instance."""
         fake_chunks = [f"chunk{i}".encode() * 100 for i in range(9)]
@@ -412,7 +403,6 @@ class TestTrimHighlightIntegration:
             pytest.skip("GEMINI_API_KEY not set in environment")
         return HighlightTrimmer(model_name="gemini-2.5-flash")
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_trim_highlight_with_real_videos(self, trimmer_with_api):
         """Test trim_highlight with real video assets and API (slow test)."""
@@ -473,7 +463,6 @@ class TestTrimHighlightIntegration:
 class TestTrimHighlightEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @pytest.mark.asyncio
     async def test_trim_single_chunk_selection(self):
         """Test trimming to a single chunk."""
         trimmer = HighlightTrimmer()
@@ -509,7 +498,6 @@ class TestTrimHighlightEdgeCases:
                 assert result_metadata["trimmed_chunk_end"] == 5
                 assert result_metadata["trimmed_chunk_count"] == 1
 
-    @pytest.mark.asyncio
     async def test_trim_all_chunks_selection(self):
         """Test trimming that keeps all chunks."""
         trimmer = HighlightTrimmer()
@@ -545,7 +533,6 @@ class TestTrimHighlightEdgeCases:
                 assert result_metadata["trimmed_chunk_end"] == 9
                 assert result_metadata["trimmed_chunk_count"] == 9
 
-    @pytest.mark.asyncio
     async def test_trim_with_empty_reasoning(self):
         """Test trimming with empty reasoning field."""
         trimmer = HighlightTrimmer()